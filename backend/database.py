@@ -3,9 +3,14 @@
 Uses asyncpg with SQLAlchemy for async PostgreSQL access.
 """
 import os
+import socket
+import struct
+import weakref
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import numpy as np
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 # Database URL from environment or default
@@ -15,14 +20,118 @@ DATABASE_URL = os.getenv(
 )
 
 # Create async engine
+# query_cache_size keeps compiled SQL cached client-side; statement_cache_size
+# lets asyncpg reuse server-side prepared statements across requests.
+# Pool sizing must cover peak concurrent /api/chat SSE requests — an
+# undersized pool locks up under load, so it's tunable per deployment.
 engine = create_async_engine(
     DATABASE_URL,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "50")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "50")),
     pool_pre_ping=True,
+    query_cache_size=1024,
+    connect_args={
+        "statement_cache_size": 1024,
+        "command_timeout": 600,
+        # jit off: PostgreSQL JIT compiles plans for large statements (bulk
+        # import) and costs more than it saves on this workload
+        "server_settings": {
+            "jit": "off",
+            "application_name": "docqa-backend",
+        },
+    },
     echo=os.getenv("SQL_DEBUG", "").lower() == "true",
 )
 
+
+def encode_vector(value) -> bytes:
+    """Encode an embedding in pgvector's binary wire format.
+
+    Layout: uint16 dimension, uint16 unused, then dimension big-endian float4
+    values. Sending binary avoids per-element str(float) formatting here and
+    text re-parsing on the server.
+    """
+    vec = np.asarray(value, dtype=">f4")
+    return struct.pack(">HH", len(vec), 0) + vec.tobytes()
+
+
+def decode_vector(data: bytes) -> np.ndarray:
+    """Decode pgvector's binary wire format to a float32 ndarray."""
+    dim, _ = struct.unpack_from(">HH", data)
+    return np.frombuffer(data, dtype=">f4", offset=4, count=dim).astype(np.float32)
+
+
+def encode_halfvec(value) -> bytes:
+    """Encode an embedding in pgvector's halfvec (FP16) wire format."""
+    vec = np.asarray(value, dtype=">f2")
+    return struct.pack(">HH", len(vec), 0) + vec.tobytes()
+
+
+def decode_halfvec(data: bytes) -> np.ndarray:
+    """Decode pgvector's halfvec wire format to a float32 ndarray."""
+    dim, _ = struct.unpack_from(">HH", data)
+    return np.frombuffer(data, dtype=">f2", offset=4, count=dim).astype(np.float32)
+
+
+# Connections that already have the vector codecs registered
+_vector_codec_registered: weakref.WeakSet = weakref.WeakSet()
+
+
+async def register_vector_codec(raw):
+    """Register the pgvector binary codecs on a raw asyncpg connection (once).
+
+    Both the float32 vector type and the FP16 halfvec type are covered;
+    halfvec is skipped silently on pgvector builds that predate it.
+    """
+    if raw in _vector_codec_registered:
+        return
+    await raw.set_type_codec(
+        "vector",
+        schema="public",
+        encoder=encode_vector,
+        decoder=decode_vector,
+        format="binary",
+    )
+    try:
+        await raw.set_type_codec(
+            "halfvec",
+            schema="public",
+            encoder=encode_halfvec,
+            decoder=decode_halfvec,
+            format="binary",
+        )
+    except ValueError:
+        pass
+    _vector_codec_registered.add(raw)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _register_codecs(dbapi_conn, _record):
+    """Install the binary vector codec on every pooled engine connection."""
+    try:
+        dbapi_conn.run_async(register_vector_codec)
+    except ValueError:
+        # vector type not present (extension not yet created) — text fallback
+        pass
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _tune_socket(dbapi_conn, _record):
+    """Disable Nagle and widen the send buffer on new connections.
+
+    The import path streams pipelined COPY traffic; small-packet delays
+    from Nagle's algorithm stall it on loopback/LAN links.
+    """
+    try:
+        transport = dbapi_conn._connection._transport
+        sock = transport.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 << 20)
+    except (AttributeError, OSError):
+        # Unix sockets / unexpected driver internals: nothing to tune
+        pass
+
 # Session factory
 async_session = async_sessionmaker(
     engine,
@@ -8,21 +8,57 @@ import argparse
 import asyncio
 import logging
 import re
+import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import asyncpg
+import numpy as np
 import pandas as pd
-from sqlalchemy import text
+import pyarrow.parquet as pq
 
 # Support both module and standalone execution
 try:
-    from .database import get_db_session
+    from .database import DATABASE_URL, register_vector_codec
 except ImportError:
-    from database import get_db_session
+    from database import DATABASE_URL, register_vector_codec
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Compiled once: extract_page_numbers runs for every imported text unit
+_PAGE_RE = re.compile(r'<!-- PAGE (\d+) -->')
+
+
+# Module-level pool: the bulk path talks to asyncpg directly, skipping the
+# SQLAlchemy session/unit-of-work layer that buys nothing for COPY traffic
+_pool: asyncpg.Pool | None = None
+
+
+async def _get_pool() -> asyncpg.Pool:
+    """Return the shared asyncpg pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = await asyncpg.create_pool(
+            DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"),
+            min_size=4,
+            max_size=16,
+            command_timeout=600,
+            # Every pooled connection gets the binary vector codec up front
+            init=register_vector_codec,
+        )
+    return _pool
+
+
+async def _close_pool():
+    """Close the shared pool (end of a CLI run)."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
 def extract_page_numbers(text_content: str) -> tuple[int | None, int | None]:
     """Extract page numbers from text containing <!-- PAGE N --> markers.
 
@@ -32,12 +68,15 @@ def extract_page_numbers(text_content: str) -> tuple[int | None, int | None]:
     if not text_content:
         return None, None
 
-    pages = re.findall(r'<!-- PAGE (\d+) -->', text_content)
-    if not pages:
-        return None, None
+    page_start = page_end = None
+    for match in _PAGE_RE.finditer(text_content):
+        page = int(match.group(1))
+        if page_start is None or page < page_start:
+            page_start = page
+        if page_end is None or page > page_end:
+            page_end = page
 
-    page_nums = [int(p) for p in pages]
-    return min(page_nums), max(page_nums)
+    return page_start, page_end
 
 
 async def import_collection(parquet_dir: Path, collection_name: str) -> int:
@@ -54,67 +93,224 @@ async def import_collection(parquet_dir: Path, collection_name: str) -> int:
     if not parquet_dir.exists():
         raise ValueError(f"Directory not found: {parquet_dir}")
 
-    async with get_db_session() as db:
-        # Create collection
-        result = await db.execute(
-            text("INSERT INTO collections (name) VALUES (:name) RETURNING id"),
-            {"name": collection_name}
-        )
-        collection_id = result.scalar_one()
-        logger.info(f"Created collection '{collection_name}' with ID {collection_id}")
+    pool = await _get_pool()
+
+    # Create the collection and import documents first; the remaining parquets
+    # are independent of each other (no cross-FKs enforced at insert time), so
+    # they load concurrently on separate pool connections.
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute("SET LOCAL synchronous_commit = OFF")
+
+            collection_id = await conn.fetchval(
+                "INSERT INTO collections (name) VALUES ($1) RETURNING id",
+                collection_name,
+            )
+            logger.info(f"Created collection '{collection_name}' with ID {collection_id}")
+
+            await _import_documents(conn, collection_id, parquet_dir)
+
+    async def _run(importer):
+        # One connection (and transaction) per import so they can run in parallel
+        async with pool.acquire() as task_conn:
+            async with task_conn.transaction():
+                await task_conn.execute("SET LOCAL synchronous_commit = OFF")
+                await importer(task_conn, collection_id, parquet_dir)
+
+    await asyncio.gather(
+        _run(_import_text_units),
+        _run(_import_entities),
+        _run(_import_nodes),
+        _run(_import_relationships),
+        _run(_import_communities),
+        _run(_import_community_reports),
+    )
+
+    # Post-process: populate source_file in text_units from documents
+    async with pool.acquire() as conn:
+        await _update_text_unit_source_files(conn, collection_id)
+        # Tell API processes to refresh their collections cache
+        await conn.execute("NOTIFY collections_changed")
+
+    logger.info(f"Import complete for collection {collection_id}")
+    return collection_id
+
+
+def _to_list(value) -> list:
+    """Normalize a parquet cell to a plain list (handles str/ndarray/None)."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return list(value)
+
+
+def _to_embedding(value) -> np.ndarray | None:
+    """Normalize an embedding cell to a float32 ndarray, or None if missing."""
+    if value is None or (hasattr(value, "__len__") and len(value) == 0):
+        return None
+    return np.asarray(value, dtype=np.float32)
+
+
+def _embedding_views(df, names: list[str]) -> "pd.Series":
+    """Coalesce embedding columns into row views of one float32 matrix.
+
+    Stacking the column once into a contiguous (N, D) matrix replaces N
+    per-row allocations with a single C-level copy; each record then carries
+    a zero-copy view into that matrix. Batches with missing or ragged rows
+    keep the per-cell arrays unchanged.
+    """
+    merged = pd.Series([None] * len(df), index=df.index, dtype=object)
+    for name in names:
+        if name in df.columns:
+            merged = merged.where(merged.notna(), df[name].map(_to_embedding))
+    if merged.isna().any():
+        return merged
+    lengths = {len(v) for v in merged}
+    if len(lengths) != 1:
+        return merged
+    matrix = np.stack(merged.to_list()).astype(np.float32, copy=False)
+    return pd.Series(list(matrix), index=df.index, dtype=object)
+
+
+# Rows per streamed parquet batch; bounds peak memory during import
+_BATCH_ROWS = 10_000
+
+
+def _batch_frames(parquet: pq.ParquetFile, columns: list[str]):
+    """Yield pandas frames of the requested columns in bounded-size batches.
+
+    Only the intersection of `columns` with the file schema is read, so
+    unused columns (GraphRAG parquets vary by version) are never decoded and
+    peak memory stays O(batch) instead of O(file).
+    """
+    available = set(parquet.schema_arrow.names)
+    selected = [c for c in columns if c in available]
+    for batch in parquet.iter_batches(batch_size=_BATCH_ROWS, columns=selected):
+        yield batch.to_pandas()
+
+
+def _column_or_none(df, name: str) -> "pd.Series":
+    """Return a column if present, else a column of None values."""
+    if name in df.columns:
+        return df[name].where(df[name].notna(), None)
+    return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+
+def _coalesce_columns(df, names: list[str]) -> "pd.Series":
+    """Column-wise equivalent of `row.get(a) or row.get(b) or ... or ""`."""
+    out = pd.Series("", index=df.index, dtype=object)
+    for name in reversed(names):
+        if name in df.columns:
+            col = df[name].fillna("")
+            out = col.where(col != "", out)
+    return out
+
+
+@asynccontextmanager
+async def _staged_copy(conn, table: str, columns: list[str]):
+    """Yield a loader that COPYs batches into one staging table per import.
+
+    COPY streams all rows in one round-trip instead of one Parse/Bind/Execute
+    cycle per row. To keep ON CONFLICT DO NOTHING semantics (GraphRAG re-imports
+    can contain duplicate IDs), rows are copied into an UNLOGGED staging table
+    (no WAL for the staged rows) and promoted with a single INSERT ... SELECT.
+    Creating, promoting and dropping the staging table once per import (not
+    per batch) keeps each transaction a pipelined stream of COPY data with a
+    single flush boundary at promotion time.
+    """
+    # Unique suffix so concurrent imports don't collide on staging tables
+    staging = f"_stage_{table}_{uuid.uuid4().hex[:8]}"
+    col_list = ", ".join(columns)
+    await conn.execute(
+        f"CREATE UNLOGGED TABLE {staging} (LIKE {table} INCLUDING DEFAULTS)"
+    )
+
+    async def load(records: list[tuple]):
+        if records:
+            await conn.copy_records_to_table(staging, records=records, columns=columns)
+
+    yield load
+
+    await conn.execute(
+        f"INSERT INTO {table} ({col_list}) "
+        f"SELECT {col_list} FROM {staging} ON CONFLICT (id) DO NOTHING"
+    )
+    await conn.execute(f"DROP TABLE {staging}")
 
-        # Import in dependency order
-        await _import_documents(db, collection_id, parquet_dir)
-        await _import_text_units(db, collection_id, parquet_dir)
-        await _import_entities(db, collection_id, parquet_dir)
-        await _import_nodes(db, collection_id, parquet_dir)
-        await _import_relationships(db, collection_id, parquet_dir)
-        await _import_communities(db, collection_id, parquet_dir)
-        await _import_community_reports(db, collection_id, parquet_dir)
 
-        # Post-process: populate source_file in text_units from documents
-        await _update_text_unit_source_files(db, collection_id)
+async def _executemany_rows(conn, table: str, columns: list[str], records: list[tuple]):
+    """Insert rows via asyncpg's pipelined executemany.
 
-        await db.commit()
-        logger.info(f"Import complete for collection {collection_id}")
-        return collection_id
+    For small tables a staging table plus COPY is overkill; executemany
+    prepares the INSERT once and streams all binds in a single pipeline,
+    keeping ON CONFLICT DO NOTHING inline on the target table.
+    """
+    if not records:
+        return
+
+    placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+    await conn.executemany(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+        f"ON CONFLICT (id) DO NOTHING",
+        records,
+    )
 
 
-async def _update_text_unit_source_files(db, collection_id: int):
+async def _update_text_unit_source_files(conn, collection_id: int):
     """Populate source_file in text_units from linked documents."""
     # Update source_file for text_units where document_ids[1] matches a document
     # PostgreSQL array syntax: document_ids[1] gets the first element
-    result = await db.execute(
-        text("""
-            UPDATE text_units tu
-            SET source_file = d.original_filename
-            FROM documents d
-            WHERE tu.collection_id = :collection_id
-              AND tu.document_ids[1] = d.id
-              AND tu.source_file IS NULL
-        """),
-        {"collection_id": collection_id}
+    # Both sides are restricted by collection_id so the join only touches the
+    # newly imported rows instead of scanning all text_units/documents
+    await conn.execute(
+        """
+        UPDATE text_units tu
+        SET source_file = d.original_filename
+        FROM documents d
+        WHERE tu.collection_id = $1
+          AND d.collection_id = $1
+          AND tu.document_ids[1] = d.id
+          AND tu.source_file IS NULL
+        """,
+        collection_id,
     )
     logger.info(f"Updated source_file for text units")
 
 
-async def _import_documents(db, collection_id: int, parquet_dir: Path):
+async def _import_documents(conn, collection_id: int, parquet_dir: Path):
     """Import documents from create_final_documents.parquet."""
     path = parquet_dir / "create_final_documents.parquet"
     if not path.exists():
         logger.warning("No documents parquet found")
         return
 
-    df = pd.read_parquet(path)
-    logger.info(f"Importing {len(df)} documents")
+    parquet = pq.ParquetFile(path)
+    logger.info(f"Importing {parquet.metadata.num_rows} documents")
 
     # Check for stored PDFs directory
     pdf_storage = parquet_dir / "pdfs"
 
-    for _, row in df.iterrows():
-        source = row.get("source")
-        title = row.get("title", "")
+    async with _staged_copy(
+        conn, "documents",
+        ["id", "collection_id", "title", "source", "original_filename", "pdf_path", "raw_content"],
+    ) as load:
+        for df in _batch_frames(parquet, ["id", "title", "source", "raw_content"]):
+            await load(_document_records(collection_id, df, pdf_storage))
 
+
+def _document_records(collection_id: int, df, pdf_storage: Path) -> list[tuple]:
+    """Build document records from one batch of parquet rows."""
+    # Cast columns once; only the PDF path derivation stays per row
+    ids = df["id"].astype(str).tolist()
+    titles = _column_or_none(df, "title").tolist()
+    sources = _column_or_none(df, "source").tolist()
+    raw_contents = _column_or_none(df, "raw_content").tolist()
+
+    records = []
+    for row_id, title, source, raw_content in zip(ids, titles, sources, raw_contents):
         # Derive original filename and pdf_path
         # Source may be empty - fall back to title and replace .txt with .pdf
         original_filename = None
@@ -131,253 +327,252 @@ async def _import_documents(db, collection_id: int, parquet_dir: Path):
                 if stored_pdf.exists():
                     pdf_path = str(stored_pdf)
 
-        await db.execute(
-            text("""
-                INSERT INTO documents (id, collection_id, title, source, original_filename, pdf_path, raw_content)
-                VALUES (:id, :collection_id, :title, :source, :original_filename, :pdf_path, :raw_content)
-                ON CONFLICT (id) DO NOTHING
-            """),
-            {
-                "id": str(row.get("id", "")),
-                "collection_id": collection_id,
-                "title": row.get("title"),
-                "source": source,
-                "original_filename": original_filename,
-                "pdf_path": pdf_path,
-                "raw_content": row.get("raw_content"),
-            }
-        )
+        records.append((
+            row_id,
+            collection_id,
+            title,
+            source,
+            original_filename,
+            pdf_path,
+            raw_content,
+        ))
 
+    return records
 
-async def _import_text_units(db, collection_id: int, parquet_dir: Path):
+
+async def _import_text_units(conn, collection_id: int, parquet_dir: Path):
     """Import text units from create_final_text_units.parquet."""
     path = parquet_dir / "create_final_text_units.parquet"
     if not path.exists():
         logger.warning("No text_units parquet found")
         return
 
-    df = pd.read_parquet(path)
-    logger.info(f"Importing {len(df)} text units")
-
-    for _, row in df.iterrows():
-        # Handle document_ids - could be list or string
-        doc_ids = row.get("document_ids", [])
-        if isinstance(doc_ids, str):
-            doc_ids = [doc_ids]
-        elif hasattr(doc_ids, "tolist"):
-            doc_ids = doc_ids.tolist()
-
-        # Handle embedding - could be numpy array or list
-        embedding = row.get("embedding")
-        if embedding is not None:
-            if hasattr(embedding, "tolist"):
-                embedding = embedding.tolist()
-            # Convert to pgvector format string: [1.0, 2.0, 3.0]
-            embedding = "[" + ",".join(str(x) for x in embedding) + "]"
-
+    parquet = pq.ParquetFile(path)
+    logger.info(f"Importing {parquet.metadata.num_rows} text units")
+
+    async with _staged_copy(
+        conn, "text_units",
+        ["id", "collection_id", "document_ids", "text", "n_tokens", "page_start", "page_end", "source_file", "embedding"],
+    ) as load:
+        for df in _batch_frames(
+            parquet, ["id", "document_ids", "text", "n_tokens", "source_file", "embedding"]
+        ):
+            await load(_text_unit_records(collection_id, df))
+
+
+def _text_unit_records(collection_id: int, df) -> list[tuple]:
+    """Build text unit records from one batch of parquet rows."""
+    # Normalize columns in one pass each instead of branching per row
+    ids = df["id"].astype(str)
+    doc_ids = df["document_ids"].map(_to_list) if "document_ids" in df.columns \
+        else pd.Series([[]] * len(df), index=df.index)
+    texts = df["text"].fillna("") if "text" in df.columns \
+        else pd.Series([""] * len(df), index=df.index)
+    n_tokens = df["n_tokens"].astype("Int64") if "n_tokens" in df.columns \
+        else pd.Series([pd.NA] * len(df), index=df.index)
+    source_files = _column_or_none(df, "source_file")
+    embeddings = _embedding_views(df, ["embedding"])
+
+    records = []
+    for row_id, dids, text_content, nt, source_file, embedding in zip(
+        ids, doc_ids, texts, n_tokens, source_files, embeddings
+    ):
         # Extract page numbers from text content (if page markers present)
-        text_content = row.get("text", "")
         page_start, page_end = extract_page_numbers(text_content)
 
-        # Get source_file from parquet if available (set during indexing)
-        source_file = row.get("source_file")
-        if pd.isna(source_file):
-            source_file = None
-
-        await db.execute(
-            text("""
-                INSERT INTO text_units (id, collection_id, document_ids, text, n_tokens, page_start, page_end, source_file, embedding)
-                VALUES (:id, :collection_id, :document_ids, :text, :n_tokens, :page_start, :page_end, :source_file, :embedding)
-                ON CONFLICT (id) DO NOTHING
-            """),
-            {
-                "id": str(row.get("id", "")),
-                "collection_id": collection_id,
-                "document_ids": doc_ids,
-                "text": text_content,
-                "n_tokens": int(row.get("n_tokens", 0)) if pd.notna(row.get("n_tokens")) else None,
-                "page_start": page_start,
-                "page_end": page_end,
-                "source_file": source_file,
-                "embedding": embedding,
-            }
-        )
+        records.append((
+            row_id,
+            collection_id,
+            dids,
+            text_content,
+            int(nt) if pd.notna(nt) else None,
+            page_start,
+            page_end,
+            source_file,
+            embedding,
+        ))
+
+    return records
 
 
-async def _import_entities(db, collection_id: int, parquet_dir: Path):
+async def _import_entities(conn, collection_id: int, parquet_dir: Path):
     """Import entities from create_final_entities.parquet."""
     path = parquet_dir / "create_final_entities.parquet"
     if not path.exists():
         logger.warning("No entities parquet found")
         return
 
-    df = pd.read_parquet(path)
-    logger.info(f"Importing {len(df)} entities")
-
-    for _, row in df.iterrows():
-        # Handle text_unit_ids - could be list or string
-        text_unit_ids = row.get("text_unit_ids", [])
-        if isinstance(text_unit_ids, str):
-            text_unit_ids = [text_unit_ids]
-        elif hasattr(text_unit_ids, "tolist"):
-            text_unit_ids = text_unit_ids.tolist()
-
-        # Handle embedding - GraphRAG uses 'description_embedding' not 'embedding'
-        embedding = row.get("description_embedding")
-        if embedding is None or (hasattr(embedding, '__len__') and len(embedding) == 0):
-            embedding = row.get("embedding")
-        if embedding is not None:
-            if hasattr(embedding, "tolist"):
-                embedding = embedding.tolist()
-            # Convert to pgvector format string: [1.0, 2.0, 3.0]
-            embedding = "[" + ",".join(str(x) for x in embedding) + "]"
-
-        # GraphRAG uses different column names in different versions
-        name = row.get("name") or row.get("title") or row.get("entity") or ""
-        entity_type = row.get("type") or row.get("entity_type") or ""
-        description = row.get("description") or row.get("entity_description") or ""
-
-        await db.execute(
-            text("""
-                INSERT INTO entities (id, collection_id, name, type, description, text_unit_ids, embedding)
-                VALUES (:id, :collection_id, :name, :type, :description, :text_unit_ids, :embedding)
-                ON CONFLICT (id) DO NOTHING
-            """),
-            {
-                "id": str(row.get("id", "")),
-                "collection_id": collection_id,
-                "name": name,
-                "type": entity_type,
-                "description": description,
-                "text_unit_ids": text_unit_ids,
-                "embedding": embedding,
-            }
+    parquet = pq.ParquetFile(path)
+    logger.info(f"Importing {parquet.metadata.num_rows} entities")
+
+    async with _staged_copy(
+        conn, "entities",
+        ["id", "collection_id", "name", "type", "description", "text_unit_ids", "embedding"],
+    ) as load:
+        for df in _batch_frames(
+            parquet,
+            ["id", "name", "title", "entity", "type", "entity_type",
+             "description", "entity_description", "text_unit_ids",
+             "description_embedding", "embedding"],
+        ):
+            await load(_entity_records(collection_id, df))
+
+
+def _entity_records(collection_id: int, df) -> list[tuple]:
+    """Build entity records from one batch of parquet rows."""
+    # Handle embedding - GraphRAG uses 'description_embedding' not 'embedding'
+    embeddings = _embedding_views(df, ["description_embedding", "embedding"])
+
+    # GraphRAG uses different column names in different versions
+    names = _coalesce_columns(df, ["name", "title", "entity"])
+    entity_types = _coalesce_columns(df, ["type", "entity_type"])
+    descriptions = _coalesce_columns(df, ["description", "entity_description"])
+    text_unit_ids = df["text_unit_ids"].map(_to_list) if "text_unit_ids" in df.columns \
+        else pd.Series([[]] * len(df), index=df.index)
+
+    records = [
+        (row_id, collection_id, name, entity_type, description, tu_ids, embedding)
+        for row_id, name, entity_type, description, tu_ids, embedding in zip(
+            df["id"].astype(str), names, entity_types, descriptions, text_unit_ids, embeddings
         )
+    ]
 
+    return records
 
-async def _import_nodes(db, collection_id: int, parquet_dir: Path):
+
+async def _import_nodes(conn, collection_id: int, parquet_dir: Path):
     """Import nodes from create_final_nodes.parquet."""
     path = parquet_dir / "create_final_nodes.parquet"
     if not path.exists():
         logger.warning("No nodes parquet found")
         return
 
-    df = pd.read_parquet(path)
-    logger.info(f"Importing {len(df)} nodes")
-
-    for _, row in df.iterrows():
-        community = row.get("community")
-        if pd.isna(community):
-            community = None
-        else:
-            community = int(community)
-
-        await db.execute(
-            text("""
-                INSERT INTO nodes (id, collection_id, community, level, degree)
-                VALUES (:id, :collection_id, :community, :level, :degree)
-                ON CONFLICT (id) DO NOTHING
-            """),
-            {
-                "id": str(row.get("id", "")),
-                "collection_id": collection_id,
-                "community": community,
-                "level": int(row.get("level", 0)) if pd.notna(row.get("level")) else 0,
-                "degree": int(row.get("degree", 0)) if pd.notna(row.get("degree")) else 0,
-            }
-        )
-
-
-async def _import_relationships(db, collection_id: int, parquet_dir: Path):
+    parquet = pq.ParquetFile(path)
+    logger.info(f"Importing {parquet.metadata.num_rows} nodes")
+
+    async with _staged_copy(
+        conn, "nodes",
+        ["id", "collection_id", "community", "level", "degree"],
+    ) as load:
+        for df in _batch_frames(parquet, ["id", "community", "level", "degree"]):
+            n = len(df)
+            ids = df["id"].astype(str).tolist()
+            communities = [None if pd.isna(c) else int(c) for c in df["community"]] \
+                if "community" in df.columns else [None] * n
+            levels = df["level"].fillna(0).astype("int64").tolist() \
+                if "level" in df.columns else [0] * n
+            degrees = df["degree"].fillna(0).astype("int64").tolist() \
+                if "degree" in df.columns else [0] * n
+
+            await load([
+                (row_id, collection_id, community, level, degree)
+                for row_id, community, level, degree in zip(ids, communities, levels, degrees)
+            ])
+
+
+async def _import_relationships(conn, collection_id: int, parquet_dir: Path):
     """Import relationships from create_final_relationships.parquet."""
     path = parquet_dir / "create_final_relationships.parquet"
     if not path.exists():
         logger.warning("No relationships parquet found")
         return
 
-    df = pd.read_parquet(path)
-    logger.info(f"Importing {len(df)} relationships")
-
-    for _, row in df.iterrows():
-        # Handle text_unit_ids
-        text_unit_ids = row.get("text_unit_ids", [])
-        if isinstance(text_unit_ids, str):
-            text_unit_ids = [text_unit_ids]
-        elif hasattr(text_unit_ids, "tolist"):
-            text_unit_ids = text_unit_ids.tolist()
-
-        await db.execute(
-            text("""
-                INSERT INTO relationships (id, collection_id, source, target, description, weight, text_unit_ids)
-                VALUES (:id, :collection_id, :source, :target, :description, :weight, :text_unit_ids)
-                ON CONFLICT (id) DO NOTHING
-            """),
-            {
-                "id": str(row.get("id", "")),
-                "collection_id": collection_id,
-                "source": row.get("source", ""),
-                "target": row.get("target", ""),
-                "description": row.get("description", ""),
-                "weight": float(row.get("weight", 1.0)) if pd.notna(row.get("weight")) else 1.0,
-                "text_unit_ids": text_unit_ids,
-            }
-        )
-
-
-async def _import_communities(db, collection_id: int, parquet_dir: Path):
+    parquet = pq.ParquetFile(path)
+    logger.info(f"Importing {parquet.metadata.num_rows} relationships")
+
+    async with _staged_copy(
+        conn, "relationships",
+        ["id", "collection_id", "source", "target", "description", "weight", "text_unit_ids"],
+    ) as load:
+        for df in _batch_frames(
+            parquet, ["id", "source", "target", "description", "weight", "text_unit_ids"]
+        ):
+            n = len(df)
+            ids = df["id"].astype(str).tolist()
+            sources = _coalesce_columns(df, ["source"]).tolist()
+            targets = _coalesce_columns(df, ["target"]).tolist()
+            descriptions = _coalesce_columns(df, ["description"]).tolist()
+            weights = df["weight"].fillna(1.0).astype(float).tolist() \
+                if "weight" in df.columns else [1.0] * n
+            text_unit_ids = df["text_unit_ids"].map(_to_list).tolist() \
+                if "text_unit_ids" in df.columns else [[]] * n
+
+            await load([
+                (row_id, collection_id, source, target, description, weight, tu_ids)
+                for row_id, source, target, description, weight, tu_ids in zip(
+                    ids, sources, targets, descriptions, weights, text_unit_ids
+                )
+            ])
+
+
+async def _import_communities(conn, collection_id: int, parquet_dir: Path):
     """Import communities from create_final_communities.parquet."""
     path = parquet_dir / "create_final_communities.parquet"
     if not path.exists():
         logger.warning("No communities parquet found")
         return
 
-    df = pd.read_parquet(path)
-    logger.info(f"Importing {len(df)} communities")
-
-    for _, row in df.iterrows():
-        await db.execute(
-            text("""
-                INSERT INTO communities (id, collection_id, community, level, title)
-                VALUES (:id, :collection_id, :community, :level, :title)
-                ON CONFLICT (id) DO NOTHING
-            """),
-            {
-                "id": str(row.get("id", "")),
-                "collection_id": collection_id,
-                "community": int(row.get("community", 0)) if pd.notna(row.get("community")) else 0,
-                "level": int(row.get("level", 0)) if pd.notna(row.get("level")) else 0,
-                "title": row.get("title"),
-            }
+    parquet = pq.ParquetFile(path)
+    logger.info(f"Importing {parquet.metadata.num_rows} communities")
+
+    for df in _batch_frames(parquet, ["id", "community", "level", "title"]):
+        n = len(df)
+        ids = df["id"].astype(str).tolist()
+        communities = df["community"].fillna(0).astype("int64").tolist() \
+            if "community" in df.columns else [0] * n
+        levels = df["level"].fillna(0).astype("int64").tolist() \
+            if "level" in df.columns else [0] * n
+        titles = _column_or_none(df, "title").tolist()
+
+        records = [
+            (row_id, collection_id, community, level, title)
+            for row_id, community, level, title in zip(ids, communities, levels, titles)
+        ]
+
+        await _executemany_rows(
+            conn, "communities",
+            ["id", "collection_id", "community", "level", "title"],
+            records,
         )
 
 
-async def _import_community_reports(db, collection_id: int, parquet_dir: Path):
+async def _import_community_reports(conn, collection_id: int, parquet_dir: Path):
     """Import community reports from create_final_community_reports.parquet."""
     path = parquet_dir / "create_final_community_reports.parquet"
     if not path.exists():
         logger.warning("No community_reports parquet found")
         return
 
-    df = pd.read_parquet(path)
-    logger.info(f"Importing {len(df)} community reports")
-
-    for _, row in df.iterrows():
-        await db.execute(
-            text("""
-                INSERT INTO community_reports (id, collection_id, community, level, title, summary, full_content, rank)
-                VALUES (:id, :collection_id, :community, :level, :title, :summary, :full_content, :rank)
-                ON CONFLICT (id) DO NOTHING
-            """),
-            {
-                "id": str(row.get("id", "")),
-                "collection_id": collection_id,
-                "community": int(row.get("community", 0)) if pd.notna(row.get("community")) else 0,
-                "level": int(row.get("level", 0)) if pd.notna(row.get("level")) else 0,
-                "title": row.get("title"),
-                "summary": row.get("summary"),
-                "full_content": row.get("full_content") or row.get("content"),
-                "rank": float(row.get("rank", 0)) if pd.notna(row.get("rank")) else 0,
-            }
+    parquet = pq.ParquetFile(path)
+    logger.info(f"Importing {parquet.metadata.num_rows} community reports")
+
+    for df in _batch_frames(
+        parquet, ["id", "community", "level", "title", "summary", "full_content", "content", "rank"]
+    ):
+        n = len(df)
+        ids = df["id"].astype(str).tolist()
+        communities = df["community"].fillna(0).astype("int64").tolist() \
+            if "community" in df.columns else [0] * n
+        levels = df["level"].fillna(0).astype("int64").tolist() \
+            if "level" in df.columns else [0] * n
+        titles = _column_or_none(df, "title").tolist()
+        summaries = _column_or_none(df, "summary").tolist()
+        # GraphRAG uses 'full_content' or 'content' depending on version
+        full_contents = [v or None for v in _coalesce_columns(df, ["full_content", "content"])]
+        ranks = df["rank"].fillna(0).astype(float).tolist() \
+            if "rank" in df.columns else [0.0] * n
+
+        records = [
+            (row_id, collection_id, community, level, title, summary, full_content, rank)
+            for row_id, community, level, title, summary, full_content, rank in zip(
+                ids, communities, levels, titles, summaries, full_contents, ranks
+            )
+        ]
+
+        await _executemany_rows(
+            conn, "community_reports",
+            ["id", "collection_id", "community", "level", "title", "summary", "full_content", "rank"],
+            records,
         )
 
 
@@ -387,7 +582,20 @@ def main():
     parser.add_argument("collection_name", type=str, help="Name for this collection")
     args = parser.parse_args()
 
-    collection_id = asyncio.run(import_collection(args.parquet_dir, args.collection_name))
+    # uvloop's C event loop cuts scheduler overhead on the concurrent imports
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    async def _run():
+        try:
+            return await import_collection(args.parquet_dir, args.collection_name)
+        finally:
+            await _close_pool()
+
+    collection_id = asyncio.run(_run())
     print(f"Imported collection ID: {collection_id}")
 
 
@@ -3,26 +3,37 @@
 Standalone backend that queries PostgreSQL directly for GraphRAG data.
 No longer depends on Kotaemon.
 """
+import asyncio
 import json
 import os
-from datetime import datetime
 from typing import AsyncGenerator, Optional
-from uuid import UUID
 
 from pathlib import Path
 
+import asyncpg
+import httpx
+import numpy as np
+import orjson
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from openai import OpenAI
-
-from .database import get_db
-from .retriever import GraphRAGRetriever, RetrievalConfig
+from openai import AsyncOpenAI
+from sse_starlette.sse import EventSourceResponse
+
+from .database import async_session, get_db, DATABASE_URL
+from .retriever import (
+    EmbeddingService,
+    GraphRAGRetriever,
+    RetrievalConfig,
+    close_http_client,
+)
 
-app = FastAPI(title="DocQA API")
+# orjson serializes UUID and datetime columns natively in Rust, so rows
+# can be returned without per-field str() conversions
+app = FastAPI(title="DocQA API", default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -33,12 +44,52 @@ app.add_middleware(
 )
 
 # vLLM client for LLM inference (Qwen2.5-7B)
-llm_client = OpenAI(
+# Async client so a streaming generation never blocks the event loop;
+# HTTP/2 multiplexes concurrent streams over a single connection
+llm_client = AsyncOpenAI(
     base_url=os.getenv("VLLM_CHAT_URL", "http://vllm-chat:8000/v1"),
-    api_key="not-needed"
+    api_key="not-needed",
+    http_client=httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(600.0),
+    ),
 )
 LLM_MODEL = os.getenv("LLM_MODEL", "Qwen/Qwen2.5-7B-Instruct")
 
+# Prompt skeleton built once at import; per request only the dynamic
+# tail (history + context/question) is assembled
+SYSTEM_PROMPT = """You are a document analyst. Answer questions based on the provided context.
+Be precise. Quote relevant passages when answering.
+Use the conversation history for context about previous questions."""
+SYSTEM_MSG = {"role": "system", "content": SYSTEM_PROMPT}
+CONTEXT_FMT = "CONTEXT:\n{}\n\n---\nQUESTION: {}".format
+
+# Retrieval parameters are fixed for the process; build the config (and the
+# embedding service with its HTTP client) once instead of per request
+RETRIEVAL_CONFIG = RetrievalConfig(
+    top_k_text_units=10,
+    top_k_entities=10,
+    top_k_relationships=20,
+    top_k_community_reports=3,
+)
+
+
+@app.on_event("startup")
+async def _build_retriever():
+    """Preconstruct the retrieval path once for the process.
+
+    The retriever takes the session factory, not a session: its query
+    steps run concurrently, each on a short-lived session of its own.
+    """
+    embedding_service = EmbeddingService()
+    app.state.embedding_service = embedding_service
+    app.state.retriever = GraphRAGRetriever(
+        session_factory=async_session,
+        config=RETRIEVAL_CONFIG,
+        embedding_service=embedding_service,
+    )
+
 
 class ChatRequest(BaseModel):
     message: str
@@ -46,12 +97,6 @@ class ChatRequest(BaseModel):
     conversation_id: Optional[str] = None  # Optional conversation for context
 
 
-class Collection(BaseModel):
-    id: int
-    name: str
-    type: str
-
-
 class ConversationCreate(BaseModel):
     collection_id: int
     title: Optional[str] = None
@@ -61,50 +106,79 @@ class ConversationUpdate(BaseModel):
     title: str
 
 
-class Message(BaseModel):
-    id: str
-    role: str
-    content: str
-    sources: Optional[list] = None
-    created_at: datetime
-
-
-class Conversation(BaseModel):
-    id: str
-    collection_id: Optional[int]
-    title: Optional[str]
-    created_at: datetime
-    updated_at: datetime
-    messages: Optional[list[Message]] = None
-
-
 @app.get("/api/health")
 async def health():
     """Health check endpoint."""
     return {"status": "ok"}
 
 
+# In-process cache for /api/collections. Collections only change on import,
+# so the importer NOTIFYs 'collections_changed' and a dedicated listener
+# connection invalidates the cache instead of re-querying per request.
+_collections_cache: Optional[list[dict]] = None
+_collections_lock = asyncio.Lock()
+_notify_conn: Optional[asyncpg.Connection] = None
+
+
+def _invalidate_collections_cache(*_args):
+    global _collections_cache
+    _collections_cache = None
+
+
+@app.on_event("startup")
+async def _listen_collections_changed():
+    """Hold a dedicated connection LISTENing for collection changes."""
+    global _notify_conn
+    try:
+        _notify_conn = await asyncpg.connect(
+            DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
+        )
+        await _notify_conn.add_listener(
+            "collections_changed",
+            lambda *_: _invalidate_collections_cache(),
+        )
+    except Exception as e:
+        # Cache still works, it just never invalidates via NOTIFY
+        print(f"Collections listener unavailable: {e}")
+
+
+@app.on_event("shutdown")
+async def _close_notify_conn():
+    if _notify_conn is not None:
+        await _notify_conn.close()
+
+
+@app.on_event("shutdown")
+async def _close_embedding_client():
+    await close_http_client()
+
+
 @app.get("/api/collections")
-async def get_collections(db: AsyncSession = Depends(get_db)) -> list[Collection]:
+async def get_collections(db: AsyncSession = Depends(get_db)):
     """List available collections from the database."""
-    result = await db.execute(
-        text("SELECT id, name FROM collections ORDER BY id")
-    )
-    collections = []
-    for row in result.fetchall():
-        collections.append(Collection(
-            id=row[0],
-            name=row[1],
-            type="graphrag"
-        ))
-    return collections
+    global _collections_cache
+    if _collections_cache is not None:
+        return ORJSONResponse(_collections_cache)
+
+    async with _collections_lock:
+        if _collections_cache is None:
+            result = await db.execute(
+                text("SELECT id, name FROM collections ORDER BY id")
+            )
+            # Plain dicts straight to orjson: no Pydantic round-trip on a
+            # read-only endpoint
+            _collections_cache = [
+                {"id": row[0], "name": row[1], "type": "graphrag"}
+                for row in result.fetchall()
+            ]
+    return ORJSONResponse(_collections_cache)
 
 
 # ============================================================
 # Conversations CRUD
 # ============================================================
 
-@app.post("/api/conversations", response_model=Conversation)
+@app.post("/api/conversations")
 async def create_conversation(
     request: ConversationCreate,
     db: AsyncSession = Depends(get_db)
@@ -118,19 +192,12 @@ async def create_conversation(
         """),
         {"collection_id": request.collection_id, "title": request.title}
     )
-    row = result.fetchone()
+    row = dict(result.mappings().one())
     await db.commit()
+    return row
 
-    return Conversation(
-        id=str(row.id),
-        collection_id=row.collection_id,
-        title=row.title,
-        created_at=row.created_at,
-        updated_at=row.updated_at,
-    )
 
-
-@app.get("/api/conversations", response_model=list[Conversation])
+@app.get("/api/conversations")
 async def list_conversations(
     collection_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
@@ -155,71 +222,51 @@ async def list_conversations(
             """)
         )
 
-    return [
-        Conversation(
-            id=str(row.id),
-            collection_id=row.collection_id,
-            title=row.title,
-            created_at=row.created_at,
-            updated_at=row.updated_at,
-        )
-        for row in result.fetchall()
-    ]
+    # Raw mappings straight to orjson (UUIDs and datetimes serialize
+    # natively) — skips the per-row Pydantic construct + re-serialize
+    return ORJSONResponse([dict(r) for r in result.mappings()])
 
 
-@app.get("/api/conversations/{conversation_id}", response_model=Conversation)
+@app.get("/api/conversations/{conversation_id}")
 async def get_conversation(
     conversation_id: str,
     db: AsyncSession = Depends(get_db)
 ):
     """Get a conversation with its messages."""
-    # Get conversation
+    # One round-trip: Postgres aggregates the messages into a JSON array
+    # ordered by created_at, decoded once by the driver
     result = await db.execute(
         text("""
-            SELECT id, collection_id, title, created_at, updated_at
-            FROM conversations
-            WHERE id = :id
+            SELECT
+                c.id, c.collection_id, c.title, c.created_at, c.updated_at,
+                COALESCE(
+                    json_agg(
+                        json_build_object(
+                            'id', m.id,
+                            'role', m.role,
+                            'content', m.content,
+                            'sources', m.sources,
+                            'created_at', m.created_at
+                        ) ORDER BY m.created_at
+                    ) FILTER (WHERE m.id IS NOT NULL),
+                    '[]'
+                ) AS messages
+            FROM conversations c
+            LEFT JOIN messages m ON m.conversation_id = c.id
+            WHERE c.id = :id
+            GROUP BY c.id
         """),
         {"id": conversation_id}
     )
-    conv_row = result.fetchone()
+    conv_row = result.mappings().first()
 
     if not conv_row:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Get messages
-    result = await db.execute(
-        text("""
-            SELECT id, role, content, sources, created_at
-            FROM messages
-            WHERE conversation_id = :conversation_id
-            ORDER BY created_at ASC
-        """),
-        {"conversation_id": conversation_id}
-    )
-
-    messages = [
-        Message(
-            id=str(row.id),
-            role=row.role,
-            content=row.content,
-            sources=row.sources,
-            created_at=row.created_at,
-        )
-        for row in result.fetchall()
-    ]
-
-    return Conversation(
-        id=str(conv_row.id),
-        collection_id=conv_row.collection_id,
-        title=conv_row.title,
-        created_at=conv_row.created_at,
-        updated_at=conv_row.updated_at,
-        messages=messages,
-    )
+    return dict(conv_row)
 
 
-@app.patch("/api/conversations/{conversation_id}", response_model=Conversation)
+@app.patch("/api/conversations/{conversation_id}")
 async def update_conversation(
     conversation_id: str,
     request: ConversationUpdate,
@@ -235,19 +282,13 @@ async def update_conversation(
         """),
         {"id": conversation_id, "title": request.title}
     )
-    row = result.fetchone()
+    row = result.mappings().first()
     await db.commit()
 
     if not row:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return Conversation(
-        id=str(row.id),
-        collection_id=row.collection_id,
-        title=row.title,
-        created_at=row.created_at,
-        updated_at=row.updated_at,
-    )
+    return dict(row)
 
 
 @app.delete("/api/conversations/{conversation_id}")
@@ -269,8 +310,136 @@ async def delete_conversation(
     return {"status": "deleted", "id": conversation_id}
 
 
-@app.post("/api/chat")
-async def chat(request: ChatRequest, db: AsyncSession = Depends(get_db)):
+def _sse(event: dict) -> dict:
+    """Build one SSE event for EventSourceResponse.
+
+    orjson encodes the small event dicts in Rust; EventSourceResponse does
+    the wire framing. Events stay unnamed so existing onmessage clients
+    keep working — this runs once per token.
+    """
+    return {"data": orjson.dumps(event).decode()}
+
+
+# Pre-built JSON envelope for per-token chat events: the hot loop only
+# escapes the content string instead of building and encoding a dict
+_CHAT_PREFIX = '{"type":"chat","content":'
+_CHAT_SUFFIX = '}'
+
+
+def _sse_chat(content: str) -> dict:
+    """Build a chat-content SSE event from the preformatted template."""
+    return {"data": _CHAT_PREFIX + orjson.dumps(content).decode() + _CHAT_SUFFIX}
+
+
+# Hot chat-path SQL, compiled once at import. Combined with the engine's
+# query cache and asyncpg's prepared-statement cache, Postgres reuses the
+# parsed plan instead of re-parsing per request.
+HISTORY_SQL = text("""
+    SELECT role, content FROM messages
+    WHERE conversation_id = :conversation_id
+    ORDER BY created_at ASC
+    LIMIT 10
+""").bindparams(bindparam("conversation_id"))
+
+SAVE_MESSAGES_SQL = text("""
+    WITH u AS (
+        INSERT INTO messages (conversation_id, role, content)
+        VALUES (:conversation_id, 'user', :user_content)
+    ), a AS (
+        INSERT INTO messages (conversation_id, role, content, sources)
+        VALUES (:conversation_id, 'assistant', :assistant_content, :sources)
+    )
+    UPDATE conversations SET updated_at = CURRENT_TIMESTAMP
+    WHERE id = :conversation_id
+""").bindparams(
+    bindparam("conversation_id"),
+    bindparam("user_content"),
+    bindparam("assistant_content"),
+    bindparam("sources"),
+)
+
+
+async def bulk_insert_messages(db: AsyncSession, rows: list[tuple]):
+    """Bulk-load messages via COPY for batch persistence paths.
+
+    For the two messages a chat turn writes, COPY is overkill — the CTE
+    insert handles that. Use this when persisting messages in bulk (e.g.
+    prefetched Q/A pairs): one COPY stream instead of N inserts. Rows are
+    (conversation_id, role, content, sources) with sources already encoded
+    as a JSON string or None.
+    """
+    if not rows:
+        return
+    raw = (await (await db.connection()).get_raw_connection()).driver_connection
+    await raw.copy_records_to_table(
+        "messages",
+        records=rows,
+        columns=["conversation_id", "role", "content", "sources"],
+    )
+
+
+# ============================================================
+# Answer cache
+# ============================================================
+# Two-tier cache so repeated (or near-identical) questions skip vector
+# retrieval and the full LLM decode: an exact-match dict probed first,
+# then a per-collection semantic tier matched on query-embedding cosine
+# similarity. Entries hold (sources, answer) and are evicted FIFO.
+_CACHE_SIMILARITY = 0.95
+_CACHE_MAX_ENTRIES = 256
+_exact_cache: dict[tuple[int, str], tuple[list, str]] = {}
+_semantic_cache: dict[int, list[tuple["np.ndarray", list, str]]] = {}
+
+
+def _probe_semantic_cache(collection_id: int, query_embedding: list[float]):
+    """Return (sources, answer) for the nearest cached query, or None."""
+    entries = _semantic_cache.get(collection_id)
+    if not entries:
+        return None
+    q = np.asarray(query_embedding, dtype=np.float32)
+    norm = np.linalg.norm(q)
+    if norm == 0:
+        return None
+    # Out-of-place: asarray aliases the caller's (and embed cache's) array
+    # when it's already float32, and that must not be renormalized
+    q = q / norm
+    best = None
+    best_sim = _CACHE_SIMILARITY
+    for cached_embedding, sources, answer in entries:
+        # Cached embeddings are stored normalized, so dot == cosine
+        sim = float(cached_embedding @ q)
+        if sim >= best_sim:
+            best_sim = sim
+            best = (sources, answer)
+    return best
+
+
+def _store_answer(collection_id: int, message: str,
+                  query_embedding: Optional[list[float]],
+                  sources: list, answer: str):
+    """Record a finished answer in both cache tiers."""
+    _exact_cache[(collection_id, message)] = (sources, answer)
+    while len(_exact_cache) > _CACHE_MAX_ENTRIES:
+        _exact_cache.pop(next(iter(_exact_cache)))
+
+    if query_embedding is not None:
+        q = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(q)
+        if norm > 0:
+            entries = _semantic_cache.setdefault(collection_id, [])
+            entries.append((q / norm, sources, answer))
+            while len(entries) > _CACHE_MAX_ENTRIES:
+                entries.pop(0)
+
+
+def _chunk_answer(answer: str, size: int = 64):
+    """Re-chunk a cached answer so the client still sees a stream."""
+    for i in range(0, len(answer), size):
+        yield answer[i:i + size]
+
+
+@app.post("/api/chat", response_class=EventSourceResponse)
+async def chat(request: ChatRequest):
     """Stream chat response using SSE.
 
     1. Load conversation history if conversation_id provided
@@ -278,20 +447,22 @@ async def chat(request: ChatRequest, db: AsyncSession = Depends(get_db)):
     3. Build prompt with history + context
     4. Stream LLM response
     5. Save messages to database
+
+    Sessions are opened only around the DB phases — the pool connection
+    is released before the multi-second LLM stream, so concurrent chats
+    can't starve the pool while tokens are being generated.
     """
     # Load conversation history if provided
     history_messages = []
     if request.conversation_id:
-        result = await db.execute(
-            text("""
-                SELECT role, content FROM messages
-                WHERE conversation_id = :conversation_id
-                ORDER BY created_at ASC
-                LIMIT 10
-            """),
-            {"conversation_id": request.conversation_id}
-        )
-        history_messages = [{"role": row.role, "content": row.content} for row in result.fetchall()]
+        async with async_session() as db:
+            result = await db.execute(
+                HISTORY_SQL,
+                {"conversation_id": request.conversation_id}
+            )
+            # mappings() avoids per-attribute Row lookups; the dicts feed
+            # the OpenAI messages array directly
+            history_messages = [dict(m) for m in result.mappings()]
 
     # We need to collect data during streaming for saving later
     sources_data = []
@@ -301,95 +472,100 @@ async def chat(request: ChatRequest, db: AsyncSession = Depends(get_db)):
         nonlocal sources_data, full_response
 
         try:
-            # Initialize retriever
-            retriever = GraphRAGRetriever(
-                db=db,
-                config=RetrievalConfig(
-                    top_k_text_units=10,
-                    top_k_entities=10,
-                    top_k_relationships=20,
-                    top_k_community_reports=3,
-                )
-            )
+            # Warm path: exact match first, then a semantic neighbor probe
+            # (neither touches the database)
+            query_embedding = None
+            cached = _exact_cache.get((request.collection_id, request.message))
+            if cached is None:
+                query_embedding = await app.state.embedding_service.embed(request.message)
+                cached = _probe_semantic_cache(request.collection_id, query_embedding)
+
+            if cached is not None:
+                cached_sources, cached_answer = cached
+                sources_data = cached_sources
+                full_response.append(cached_answer)
+                yield _sse({'type': 'info', 'sources': cached_sources})
+                for piece in _chunk_answer(cached_answer):
+                    yield _sse_chat(piece)
+                yield _sse({'type': 'done'})
+                return
 
-            # Retrieve context for current query
-            context = await retriever.retrieve(
+            # Retrieve context, reusing the embedding from the cache probe.
+            # The retriever manages its own short-lived sessions, so no
+            # connection is held once it returns
+            context = await app.state.retriever.retrieve(
                 query=request.message,
                 collection_id=request.collection_id,
+                query_embedding=query_embedding,
             )
 
-            # Format sources for frontend with page numbers
-            sources = []
-            for tu in context.text_units:
-                doc_ids = tu.get("document_ids") or []
-                if isinstance(doc_ids, str):
-                    doc_ids = [doc_ids]
-                file_id = doc_ids[0] if doc_ids else None
-
-                sources.append({
-                    "file_id": file_id,
+            # Format sources for frontend with page numbers. document_ids
+            # is a TEXT[] column, so it arrives as a list (or None) — no
+            # per-row isinstance branch needed
+            sources = [
+                {
+                    "file_id": (tu.get("document_ids") or [None])[0],
                     "file_name": tu.get("source_file") or "Unknown",
                     "page_number": tu.get("page_start"),
                     "page_end": tu.get("page_end"),
-                    "text_snippet": tu.get("text", "")[:300],
+                    "text_snippet": tu.get("text_snippet") or "",
                     "relevance_score": tu.get("similarity", 0),
-                })
+                }
+                for tu in context.text_units
+            ]
 
             # Add entity sources
-            for entity in context.entities[:5]:
-                sources.append({
+            sources += [
+                {
                     "file_id": None,
                     "file_name": f"Entity: {entity.get('name', '')}",
                     "page_number": None,
                     "text_snippet": entity.get("description", "")[:300],
                     "relevance_score": entity.get("similarity", 0),
-                })
+                }
+                for entity in context.entities[:5]
+            ]
 
             sources_data = sources
-            yield f"data: {json.dumps({'type': 'info', 'sources': sources})}\n\n"
+            yield _sse({'type': 'info', 'sources': sources})
 
             # Build prompt context
             prompt_context = context.to_prompt_context()
 
             if not prompt_context.strip():
-                yield f"data: {json.dumps({'type': 'error', 'error': 'No context found for this collection'})}\n\n"
+                yield _sse({'type': 'error', 'error': 'No context found for this collection'})
                 return
 
-            # Build messages array with system prompt, history, and current query
-            system_prompt = """You are a document analyst. Answer questions based on the provided context.
-Be precise. Quote relevant passages when answering.
-Use the conversation history for context about previous questions."""
-
-            messages = [{"role": "system", "content": system_prompt}]
-
-            # Add conversation history (without re-adding context each time)
-            for msg in history_messages:
-                messages.append(msg)
-
-            # Add current query with fresh context
-            messages.append({
-                "role": "user",
-                "content": f"CONTEXT:\n{prompt_context}\n\n---\nQUESTION: {request.message}"
-            })
+            # System prompt, history (without re-adding context each time),
+            # then the current query with fresh context
+            messages = [
+                SYSTEM_MSG,
+                *history_messages,
+                {"role": "user", "content": CONTEXT_FMT(prompt_context, request.message)},
+            ]
 
             # Stream LLM response
-            response = llm_client.chat.completions.create(
+            response = await llm_client.chat.completions.create(
                 model=LLM_MODEL,
                 messages=messages,
                 max_tokens=1000,
                 stream=True,
             )
 
-            for chunk in response:
+            async for chunk in response:
                 if chunk.choices[0].delta.content:
                     content = chunk.choices[0].delta.content
                     full_response.append(content)
-                    yield f"data: {json.dumps({'type': 'chat', 'content': content})}\n\n"
+                    yield _sse_chat(content)
 
-            yield f"data: {json.dumps({'type': 'done'})}\n\n"
+            _store_answer(
+                request.collection_id, request.message,
+                query_embedding, sources_data, "".join(full_response),
+            )
+            yield _sse({'type': 'done'})
 
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+            yield _sse({'type': 'error', 'error': str(e)})
 
     async def generate_and_save():
         """Wrapper that saves messages after streaming completes."""
@@ -399,46 +575,34 @@ Use the conversation history for context about previous questions."""
         # Save messages to database if conversation_id provided
         if request.conversation_id and full_response:
             try:
-                # Save user message
-                await db.execute(
-                    text("""
-                        INSERT INTO messages (conversation_id, role, content)
-                        VALUES (:conversation_id, 'user', :content)
-                    """),
-                    {"conversation_id": request.conversation_id, "content": request.message}
-                )
-
-                # Save assistant response with sources
-                await db.execute(
-                    text("""
-                        INSERT INTO messages (conversation_id, role, content, sources)
-                        VALUES (:conversation_id, 'assistant', :content, :sources)
-                    """),
-                    {
-                        "conversation_id": request.conversation_id,
-                        "content": "".join(full_response),
-                        "sources": json.dumps(sources_data) if sources_data else None,
-                    }
-                )
-
-                # Update conversation timestamp
-                await db.execute(
-                    text("UPDATE conversations SET updated_at = CURRENT_TIMESTAMP WHERE id = :id"),
-                    {"id": request.conversation_id}
-                )
-
-                await db.commit()
+                # Fresh session for the save; both inserts and the timestamp
+                # bump go out as one CTE statement — one round-trip
+                async with async_session() as db:
+                    await db.execute(
+                        SAVE_MESSAGES_SQL,
+                        {
+                            "conversation_id": request.conversation_id,
+                            "user_content": request.message,
+                            "assistant_content": "".join(full_response),
+                            "sources": json.dumps(sources_data) if sources_data else None,
+                        }
+                    )
+                    await db.commit()
             except Exception as e:
                 # Log but don't fail the response
                 print(f"Error saving messages: {e}")
 
-    return StreamingResponse(
+    # EventSourceResponse handles framing and cache headers, and its
+    # keep-alive pings stop proxies dropping the stream mid-generation.
+    # The explicit headers stop Nginx-style proxies and compression
+    # middleware buffering the stream until the response ends.
+    return EventSourceResponse(
         generate_and_save(),
-        media_type="text/event-stream",
+        ping=15,
         headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
+            "X-Accel-Buffering": "no",
+            "Content-Encoding": "identity",
+        },
     )
 
 
@@ -458,11 +622,16 @@ async def get_pdf(doc_id: str, db: AsyncSession = Depends(get_db)):
         raise HTTPException(status_code=404, detail="PDF not found")
 
     pdf_path = Path(row.pdf_path)
-    if not pdf_path.exists():
+    # One stat() doubles as the existence check and is handed to
+    # FileResponse so it doesn't stat the file again before sending
+    try:
+        stat_result = os.stat(pdf_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="PDF file missing from storage")
 
     return FileResponse(
         pdf_path,
+        stat_result=stat_result,
         media_type="application/pdf",
         filename=row.original_filename or pdf_path.name
     )
@@ -470,4 +639,5 @@ async def get_pdf(doc_id: str, db: AsyncSession = Depends(get_db)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # "auto" picks uvloop + httptools when installed, stock asyncio otherwise
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")
@@ -3,14 +3,34 @@
 Replaces Kotaemon's GraphRAGRetrieverPipeline with direct PostgreSQL queries.
 Uses pgvector for similarity search and joins for graph traversal.
 """
+import asyncio
+import hashlib
 import os
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Optional
 
 import httpx
+import numpy as np
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Tracing is optional: spans tell compute-bound from I/O-bound before any
+# further optimization, but the SDK isn't a hard dependency — without it
+# every span is a no-op nullcontext
+try:
+    from opentelemetry import trace
+
+    _tracer = trace.get_tracer(__name__)
+
+    def _span(name: str):
+        return _tracer.start_as_current_span(name)
+except ImportError:
+    from contextlib import nullcontext
+
+    def _span(name: str):
+        return nullcontext()
+
 
 @dataclass
 class RetrievalConfig:
@@ -19,6 +39,8 @@ class RetrievalConfig:
     top_k_entities: int = 10
     top_k_relationships: int = 20
     top_k_community_reports: int = 3
+    # HNSW search-time candidate list size; higher trades latency for recall
+    ef_search: int = 40
 
 
 @dataclass
@@ -30,62 +52,280 @@ class RetrievedContext:
     community_reports: list[dict] = field(default_factory=list)
 
     def to_prompt_context(self) -> str:
-        """Format context for LLM prompt."""
+        """Format context for LLM prompt.
+
+        Each section is one generator feeding str.join rather than repeated
+        list appends — with hundreds of rows the per-iteration append and
+        interleaved f-string bytecode add up.
+        """
         parts = []
 
         if self.community_reports:
             parts.append("## Community Summaries\n")
-            for cr in self.community_reports:
-                title = cr.get("title", "Untitled")
-                content = cr.get("full_content") or cr.get("summary") or ""
-                parts.append(f"### {title}\n{content}\n\n")
+            parts.append("".join(
+                f"### {cr.get('title', 'Untitled')}\n"
+                f"{cr.get('full_content') or cr.get('summary') or ''}\n\n"
+                for cr in self.community_reports
+            ))
 
         if self.entities:
             parts.append("## Entities\n")
-            for e in self.entities:
-                name = e.get("name", "")
-                etype = e.get("type", "")
-                desc = e.get("description", "")
-                if desc:
-                    parts.append(f"- **{name}** ({etype}): {desc}\n")
-                else:
-                    parts.append(f"- **{name}** ({etype})\n")
+            parts.append("".join(
+                f"- **{e.get('name', '')}** ({e.get('type', '')}): {desc}\n"
+                if (desc := e.get("description", ""))
+                else f"- **{e.get('name', '')}** ({e.get('type', '')})\n"
+                for e in self.entities
+            ))
 
         if self.relationships:
             parts.append("\n## Relationships\n")
-            for r in self.relationships:
-                source = r.get("source", "")
-                target = r.get("target", "")
-                desc = r.get("description", "")
-                parts.append(f"- {source} → {target}: {desc}\n")
+            parts.append("".join(
+                f"- {r.get('source', '')} → {r.get('target', '')}: "
+                f"{r.get('description', '')}\n"
+                for r in self.relationships
+            ))
 
         if self.text_units:
             parts.append("\n## Source Texts\n")
-            for i, tu in enumerate(self.text_units, 1):
-                text_content = tu.get("text", "")
-                parts.append(f"[{i}] {text_content}\n\n")
+            parts.append("".join(
+                f"[{i}] {tu.get('text', '')}\n\n"
+                for i, tu in enumerate(self.text_units, 1)
+            ))
 
         return "".join(parts)
 
 
+# One HTTP client shared by every EmbeddingService: per-instance clients pay
+# a TCP (+TLS) handshake each time a retriever is built, and HTTP/2 lets
+# concurrent embed calls multiplex over a single connection
+_http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=60.0,
+    limits=httpx.Limits(
+        max_keepalive_connections=40,
+        max_connections=100,
+        keepalive_expiry=30.0,
+    ),
+)
+
+
+async def close_http_client():
+    """Close the shared embedding HTTP client (app shutdown)."""
+    await _http_client.aclose()
+
+
+# Character cap applied before embedding. BGE-M3 truncates at 8192 tokens
+# server-side anyway; capping here (~2k tokens) avoids shipping and
+# tokenizing text that can't influence the resulting vector
+_MAX_EMBED_CHARS = 8000
+
+# LRU cache of embeddings keyed by blake2b(text): multi-turn chat and
+# paraphrased queries re-embed the same text across requests, and a hit
+# saves the whole HTTP round-trip. Insert/evict never crosses an await,
+# so the cache stays consistent on the event loop without a lock.
+_EMBED_CACHE: OrderedDict[bytes, np.ndarray] = OrderedDict()
+_EMBED_CACHE_MAX = 10_000
+
+# Sub-batch size and in-flight cap for embedding requests: one oversized
+# request queues behind vLLM's max-num-seqs and dominates tail latency,
+# while unbounded fan-out overwhelms the server. 32-text chunks with at
+# most 8 concurrent requests keep the GPU busy without either failure mode.
+_EMBED_SUB_BATCH = int(os.getenv("EMBED_SUB_BATCH", "32"))
+_embed_semaphore = asyncio.Semaphore(int(os.getenv("EMBED_CONCURRENCY", "8")))
+
+
 class EmbeddingService:
     """Service for generating embeddings via vLLM."""
 
     def __init__(self):
         self.vllm_url = os.getenv("VLLM_EMBED_URL", "http://vllm-embed:8000/v1")
         self.model = os.getenv("EMBEDDING_MODEL", "BAAI/bge-m3")
-        self._client = httpx.AsyncClient(timeout=60.0)
+        self._client = _http_client
 
-    async def embed(self, text: str) -> list[float]:
-        """Generate embedding for text."""
-        response = await self._client.post(
-            f"{self.vllm_url}/embeddings",
-            json={"model": self.model, "input": text}
-        )
+    async def embed(self, text: str) -> np.ndarray:
+        """Generate embedding for a single text."""
+        embeddings = await self.embed_batch([text])
+        return embeddings[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[np.ndarray]:
+        """Generate embeddings for many texts in one request.
+
+        The embeddings endpoint accepts list inputs, so N texts cost one
+        HTTP round-trip and one batched GPU forward pass instead of N.
+        Embeddings come back as float32 ndarrays: one contiguous buffer per
+        vector instead of ~1024 boxed PyFloats, and downstream consumers
+        (pgvector binds, cosine scoring) use them without conversion.
+        """
+        if not texts:
+            return []
+        texts = [t[:_MAX_EMBED_CHARS] for t in texts]
+        keys = [
+            hashlib.blake2b(t.encode(), digest_size=16).digest() for t in texts
+        ]
+
+        results: list = [None] * len(texts)
+        misses = []
+        for i, key in enumerate(keys):
+            cached = _EMBED_CACHE.get(key)
+            if cached is not None:
+                _EMBED_CACHE.move_to_end(key)
+                results[i] = cached
+            else:
+                misses.append(i)
+
+        if misses:
+            miss_texts = [texts[i] for i in misses]
+            chunks = [
+                miss_texts[start:start + _EMBED_SUB_BATCH]
+                for start in range(0, len(miss_texts), _EMBED_SUB_BATCH)
+            ]
+            chunk_results = await asyncio.gather(
+                *[self._embed_chunk(chunk) for chunk in chunks]
+            )
+            fresh = [embedding for chunk in chunk_results for embedding in chunk]
+            for i, embedding in zip(misses, fresh):
+                results[i] = embedding
+                _EMBED_CACHE[keys[i]] = embedding
+            while len(_EMBED_CACHE) > _EMBED_CACHE_MAX:
+                _EMBED_CACHE.popitem(last=False)
+
+        return results
+
+    async def _embed_chunk(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed one sub-batch, bounded by the shared in-flight semaphore."""
+        async with _embed_semaphore:
+            response = await self._client.post(
+                f"{self.vllm_url}/embeddings",
+                json={"model": self.model, "input": texts}
+            )
         if response.status_code != 200:
             raise RuntimeError(f"Embedding failed: {response.status_code} {response.text}")
         data = response.json()
-        return data["data"][0]["embedding"]
+        # The API may return items out of order; restore input order
+        return [
+            np.asarray(d["embedding"], dtype=np.float32)
+            for d in sorted(data["data"], key=lambda d: d["index"])
+        ]
+
+
+# Statements built once at import: re-constructing text() per call re-parses
+# the SQL client-side on every query; a stable object also keeps one entry in
+# SQLAlchemy's compiled cache and asyncpg's prepared-statement cache
+_SET_EF_SEARCH_SQL = text(
+    "SELECT set_config('hnsw.ef_search', :ef_search, true)"
+)
+
+_ENTITY_TEXT_UNIT_SEARCH_SQL = text("""
+    WITH top_entities AS (
+        SELECT
+            id, name, type, description, text_unit_ids,
+            1 - (embedding <=> CAST(:query_embedding AS halfvec)) AS similarity
+        FROM entities
+        WHERE collection_id = :collection_id
+          AND embedding IS NOT NULL
+        ORDER BY embedding <=> CAST(:query_embedding AS halfvec)
+        LIMIT :top_k_entities
+    ), ids AS (
+        SELECT DISTINCT unnest(text_unit_ids) AS tid FROM top_entities
+    )
+    SELECT
+        e.id, e.name, e.type, e.description, e.text_unit_ids, e.similarity,
+        (
+            SELECT json_agg(t ORDER BY t.distance)
+            FROM (
+                SELECT ranked.*
+                FROM (
+                    SELECT
+                        tu.id, tu.text, LEFT(tu.text, 300) AS text_snippet,
+                        tu.n_tokens, tu.page_start, tu.page_end,
+                        tu.source_file, tu.document_ids,
+                        1 - (tu.embedding <=> CAST(:query_embedding AS halfvec)) AS similarity,
+                        tu.embedding <=> CAST(:query_embedding AS halfvec) AS distance,
+                        SUM(COALESCE(tu.n_tokens, length(tu.text) / 4)) OVER (
+                            ORDER BY tu.embedding <=> CAST(:query_embedding AS halfvec)
+                        ) AS cum_tokens
+                    FROM text_units tu
+                    WHERE tu.collection_id = :collection_id
+                      AND tu.id IN (SELECT tid FROM ids)
+                      AND tu.embedding IS NOT NULL
+                    ORDER BY distance
+                    LIMIT :top_k_text_units
+                ) ranked
+                WHERE ranked.cum_tokens <= :token_budget
+            ) t
+        ) AS text_units
+    FROM top_entities e
+""")
+
+_ENTITY_MULTI_SEARCH_SQL = text("""
+    SELECT
+        q.i AS query_index,
+        s.id, s.name, s.type, s.description, s.text_unit_ids,
+        s.similarity
+    FROM unnest(CAST(:queries AS halfvec[]))
+         WITH ORDINALITY AS q(vec, i)
+    CROSS JOIN LATERAL (
+        SELECT id, name, type, description, text_unit_ids,
+               1 - (embedding <=> q.vec) AS similarity
+        FROM entities
+        WHERE collection_id = :collection_id
+          AND embedding IS NOT NULL
+        ORDER BY embedding <=> q.vec
+        LIMIT :top_k
+    ) s
+    ORDER BY q.i, s.similarity DESC
+""")
+
+_TEXT_UNITS_FOR_ENTITIES_SQL = text("""
+    WITH cand AS (
+        SELECT c.tid, MAX(c.sim) AS score
+        FROM unnest(CAST(:text_unit_ids AS text[]),
+                    CAST(:entity_similarities AS float8[])) AS c(tid, sim)
+        GROUP BY c.tid
+    )
+    SELECT t.id, t.text, LEFT(t.text, 300) AS text_snippet,
+           t.n_tokens, t.page_start, t.page_end, t.source_file, t.document_ids,
+           cand.score AS entity_similarity
+    FROM text_units t
+    JOIN cand ON cand.tid = t.id
+    WHERE t.collection_id = :collection_id
+    ORDER BY cand.score DESC
+    LIMIT :top_k
+""")
+
+_RELATIONSHIPS_SQL = text("""
+    SELECT
+        id, source, target, description, weight
+    FROM relationships
+    WHERE collection_id = :collection_id
+      AND (source = ANY(:entity_names) OR target = ANY(:entity_names))
+    ORDER BY weight DESC
+    LIMIT :top_k
+""")
+
+_TOP_COMMUNITY_REPORTS_SQL = text("""
+    SELECT
+        id, title, summary, full_content, rank, level
+    FROM community_reports
+    WHERE collection_id = :collection_id
+    ORDER BY rank DESC
+    LIMIT :top_k
+""")
+
+_COMMUNITY_REPORTS_FOR_ENTITIES_SQL = text("""
+    WITH cids AS (
+        SELECT DISTINCT community FROM nodes
+        WHERE collection_id = :collection_id
+          AND id = ANY(:entity_ids)
+          AND community IS NOT NULL
+    )
+    SELECT id, title, summary, full_content, rank, level
+    FROM community_reports
+    WHERE collection_id = :collection_id
+      AND community IN (SELECT community FROM cids)
+    ORDER BY rank DESC
+    LIMIT :top_k
+""")
 
 
 class GraphRAGRetriever:
@@ -102,23 +342,33 @@ class GraphRAGRetriever:
 
     def __init__(
         self,
-        db: AsyncSession,
+        session_factory,
         config: Optional[RetrievalConfig] = None,
+        embedding_service: Optional[EmbeddingService] = None,
     ):
-        self.db = db
+        # A session factory (e.g. database.async_session) rather than a
+        # bound session: retrieval steps run concurrently, and SQLAlchemy
+        # sessions are not safe to share across tasks
+        self.session_factory = session_factory
         self.config = config or RetrievalConfig()
-        self.embedding_service = EmbeddingService()
+        # Accept a shared service so callers can reuse one HTTP client
+        # across requests instead of opening a new one per retriever
+        self.embedding_service = embedding_service or EmbeddingService()
 
     async def retrieve(
         self,
         query: str,
         collection_id: int,
+        query_embedding: Optional[np.ndarray] = None,
     ) -> RetrievedContext:
         """Main retrieval entry point.
 
         Args:
             query: User's question
             collection_id: Which collection to search
+            query_embedding: Precomputed embedding of the query; pass it when
+                the caller has already embedded the query (e.g. for a cache
+                probe) so it isn't computed twice
 
         Returns:
             RetrievedContext with all retrieved information
@@ -131,104 +381,206 @@ class GraphRAGRetriever:
         5. Get relationships for found entities
         6. Get community reports connected to found entities
         """
-        # Step 1: Embed the query
-        query_embedding = await self.embedding_service.embed(query)
+        # Step 1: Embed the query (unless the caller already did)
+        if query_embedding is None:
+            with _span("retrieve.embed"):
+                query_embedding = await self.embedding_service.embed(query)
+
+        # Steps 2+3: one fused query returns the top entities and their
+        # linked text units, already ranked by stored embeddings
+        with _span("retrieve.search_entities") as span:
+            entities, ranked_text_units = await self._run_with_session(
+                self._search_entities_with_text_units, collection_id,
+                query_embedding, self.config.top_k_entities, 100, 4000,
+            )
+            if span:
+                span.set_attribute("n_entities", len(entities))
+                span.set_attribute("n_text_units", len(ranked_text_units))
+
+        # Steps 4-6 all depend only on the entity result, so the text-unit,
+        # relationship and community pipelines run concurrently, each on its
+        # own session
+        entity_names = [e["name"] for e in entities]
+        entity_ids = [e["id"] for e in entities]
 
-        # Step 2: Vector search on entities
-        entities = await self._search_entities(
-            collection_id, query_embedding, self.config.top_k_entities
-        )
+        with _span("retrieve.expand") as span:
+            text_units, relationships, community_reports = await asyncio.gather(
+                self._text_unit_pipeline(
+                    collection_id, entities, query_embedding, ranked_text_units
+                ),
+                self._run_with_session(
+                    self._get_relationships, collection_id, entity_names,
+                    self.config.top_k_relationships,
+                ),
+                self._community_pipeline(collection_id, entity_ids),
+            )
+            if span:
+                span.set_attribute("n_text_units", len(text_units))
+                span.set_attribute("n_relationships", len(relationships))
+                span.set_attribute("n_community_reports", len(community_reports))
 
-        # Step 3: Get text_units linked to found entities
-        candidate_text_units = await self._get_text_units_for_entities(
-            collection_id, entities, top_k=100
+        return RetrievedContext(
+            entities=entities,
+            relationships=relationships,
+            text_units=text_units,
+            community_reports=community_reports,
         )
 
-        # Step 4: Re-rank text_units by query similarity
-        text_units = await self._rank_text_units_by_query(
+    async def _run_with_session(self, method, *args):
+        """Run one query method on a session of its own."""
+        async with self.session_factory() as db:
+            return await method(db, *args)
+
+    async def _text_unit_pipeline(
+        self,
+        collection_id: int,
+        entities: list[dict],
+        query_embedding: np.ndarray,
+        ranked_text_units: list[dict],
+    ) -> list[dict]:
+        """Step 4: select text units for the found entities.
+
+        The entity search already returned the linked text units ranked and
+        token-budgeted server-side, so they pass straight through.
+        Collections imported before embeddings were stored come back with an
+        empty ranking and fall back to query-time embedding.
+        """
+        if ranked_text_units:
+            return ranked_text_units
+        async with self.session_factory() as db:
+            candidate_text_units = await self._get_text_units_for_entities(
+                db, collection_id, entities, top_k=100
+            )
+        return await self._rank_text_units_by_query(
             candidate_text_units, query_embedding, max_tokens=4000
         )
 
-        # Step 5: Get relationships for found entities
-        entity_names = [e["name"] for e in entities]
-        relationships = await self._get_relationships(
-            collection_id, entity_names, self.config.top_k_relationships
+    async def _community_pipeline(
+        self,
+        collection_id: int,
+        entity_ids: list[str],
+    ) -> list[dict]:
+        """Step 6: reports for the communities containing found entities."""
+        async with self.session_factory() as db:
+            return await self._get_community_reports_for_entities(
+                db, collection_id, entity_ids,
+                self.config.top_k_community_reports,
+            )
+
+    async def _search_entities_with_text_units(
+        self,
+        db: AsyncSession,
+        collection_id: int,
+        query_embedding: np.ndarray,
+        top_k_entities: int,
+        top_k_text_units: int,
+        token_budget: int,
+    ) -> tuple[list[dict], list[dict]]:
+        """Vector search on entities plus their ranked text units, one query.
+
+        A CTE takes the top entities by embedding distance, unnests their
+        text_unit_ids, and aggregates the linked text units (ranked by their
+        own stored embeddings, trimmed to the cumulative token budget by a
+        window function) into a JSON array returned alongside the entity
+        rows — one round-trip instead of two, with the join planned by
+        Postgres, and only rows that fit the budget cross the wire. The text-unit array is empty for collections imported
+        before text-unit embeddings were stored; callers fall back to
+        query-time ranking then.
+        """
+        # Tune the HNSW candidate list for this transaction only; SET LOCAL
+        # can't take a bind parameter, set_config(..., is_local=>true) can
+        await db.execute(
+            _SET_EF_SEARCH_SQL,
+            {"ef_search": str(max(self.config.ef_search, top_k_entities * 4))},
         )
 
-        # Step 6: Get community reports connected to found entities
-        entity_ids = [e["id"] for e in entities]
-        entity_communities = await self._get_communities_for_entities(
-            collection_id, entity_ids
-        )
-        community_reports = await self._get_community_reports_for_communities(
-            collection_id, entity_communities, self.config.top_k_community_reports
+        result = await db.execute(
+            _ENTITY_TEXT_UNIT_SEARCH_SQL,
+            {
+                "collection_id": collection_id,
+                "query_embedding": query_embedding,
+                "top_k_entities": top_k_entities,
+                "top_k_text_units": top_k_text_units,
+                "token_budget": token_budget,
+            }
         )
 
-        return RetrievedContext(
-            entities=entities,
-            relationships=relationships,
-            text_units=text_units,
-            community_reports=community_reports,
-        )
+        rows = result.mappings().all()
+        entities = [
+            {k: v for k, v in row.items() if k != "text_units"} for row in rows
+        ]
+        # The aggregate is uncorrelated, so every row carries the same array
+        text_units = (rows[0]["text_units"] or []) if rows else []
+        return entities, text_units
 
-    async def _search_entities(
+    async def _search_entities_multi(
         self,
+        db: AsyncSession,
         collection_id: int,
-        query_embedding: list[float],
+        query_embeddings: list[np.ndarray],
         top_k: int,
-    ) -> list[dict]:
-        """Vector similarity search on entity embeddings."""
-        embedding_str = "[" + ",".join(str(x) for x in query_embedding) + "]"
-
-        result = await self.db.execute(
-            text("""
-                SELECT
-                    id, name, type, description, text_unit_ids,
-                    1 - (embedding <=> CAST(:query_embedding AS vector)) AS similarity
-                FROM entities
-                WHERE collection_id = :collection_id
-                  AND embedding IS NOT NULL
-                ORDER BY embedding <=> CAST(:query_embedding AS vector)
-                LIMIT :top_k
-            """),
+    ) -> list[list[dict]]:
+        """Vector search on entities for several query vectors at once.
+
+        The vectors are unnested server-side and each drives its own LATERAL
+        top-k scan, so N sub-queries (decomposed questions, HyDE variants)
+        cost one round-trip and share buffer-pool hits instead of N separate
+        calls. Returns one result list per input vector, in input order.
+        """
+        if not query_embeddings:
+            return []
+
+        await db.execute(
+            _SET_EF_SEARCH_SQL,
+            {"ef_search": str(max(self.config.ef_search, top_k * 4))},
+        )
+
+        result = await db.execute(
+            _ENTITY_MULTI_SEARCH_SQL,
             {
                 "collection_id": collection_id,
-                "query_embedding": embedding_str,
+                "queries": query_embeddings,
                 "top_k": top_k,
             }
         )
 
-        return [dict(row._mapping) for row in result.fetchall()]
+        grouped: list[list[dict]] = [[] for _ in query_embeddings]
+        for row in result.mappings():
+            entity = dict(row)
+            grouped[entity.pop("query_index") - 1].append(entity)
+        return grouped
 
     async def _get_text_units_for_entities(
         self,
+        db: AsyncSession,
         collection_id: int,
         entities: list[dict],
         top_k: int,
     ) -> list[dict]:
-        """Get text_units linked to the given entities via text_unit_ids."""
-        # Collect all text_unit_ids from entities
-        all_text_unit_ids = set()
+        """Get text_units linked to the given entities via text_unit_ids.
+
+        Candidates are ordered by the best similarity of any linking entity
+        rather than taking an arbitrary LIMIT slice, so a chunk tied to a
+        strong entity match beats one tied only to the weakest.
+        """
+        tids: list[str] = []
+        sims: list[float] = []
         for e in entities:
             text_unit_ids = e.get("text_unit_ids") or []
             if isinstance(text_unit_ids, str):
                 text_unit_ids = [text_unit_ids]
-            all_text_unit_ids.update(text_unit_ids)
-
-        if not all_text_unit_ids:
+            similarity = float(e.get("similarity") or 0.0)
+            tids.extend(text_unit_ids)
+            sims.extend([similarity] * len(text_unit_ids))
+        if not tids:
             return []
 
-        result = await self.db.execute(
-            text("""
-                SELECT id, text, n_tokens, page_start, page_end, source_file, document_ids
-                FROM text_units
-                WHERE collection_id = :collection_id
-                  AND id = ANY(:text_unit_ids)
-                LIMIT :top_k
-            """),
+        result = await db.execute(
+            _TEXT_UNITS_FOR_ENTITIES_SQL,
             {
                 "collection_id": collection_id,
-                "text_unit_ids": list(all_text_unit_ids),
+                "text_unit_ids": tids,
+                "entity_similarities": sims,
                 "top_k": top_k,
             }
         )
@@ -237,6 +589,7 @@ class GraphRAGRetriever:
 
     async def _get_relationships(
         self,
+        db: AsyncSession,
         collection_id: int,
         entity_names: list[str],
         top_k: int,
@@ -245,16 +598,8 @@ class GraphRAGRetriever:
         if not entity_names:
             return []
 
-        result = await self.db.execute(
-            text("""
-                SELECT
-                    id, source, target, description, weight
-                FROM relationships
-                WHERE collection_id = :collection_id
-                  AND (source = ANY(:entity_names) OR target = ANY(:entity_names))
-                ORDER BY weight DESC
-                LIMIT :top_k
-            """),
+        result = await db.execute(
+            _RELATIONSHIPS_SQL,
             {
                 "collection_id": collection_id,
                 "entity_names": entity_names,
@@ -266,19 +611,13 @@ class GraphRAGRetriever:
 
     async def _get_community_reports(
         self,
+        db: AsyncSession,
         collection_id: int,
         top_k: int,
     ) -> list[dict]:
         """Get top community reports by rank."""
-        result = await self.db.execute(
-            text("""
-                SELECT
-                    id, title, summary, full_content, rank, level
-                FROM community_reports
-                WHERE collection_id = :collection_id
-                ORDER BY rank DESC
-                LIMIT :top_k
-            """),
+        result = await db.execute(
+            _TOP_COMMUNITY_REPORTS_SQL,
             {
                 "collection_id": collection_id,
                 "top_k": top_k,
@@ -287,20 +626,10 @@ class GraphRAGRetriever:
 
         return [dict(row._mapping) for row in result.fetchall()]
 
-    def _cosine_similarity(self, vec1: list[float], vec2: list[float]) -> float:
-        """Compute cosine similarity between two vectors."""
-        import math
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-        norm1 = math.sqrt(sum(a * a for a in vec1))
-        norm2 = math.sqrt(sum(b * b for b in vec2))
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        return dot_product / (norm1 * norm2)
-
     async def _rank_text_units_by_query(
         self,
         candidates: list[dict],
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         max_tokens: int = 4000,
     ) -> list[dict]:
         """Embed each text unit and rank by similarity to query.
@@ -311,24 +640,43 @@ class GraphRAGRetriever:
         if not candidates:
             return []
 
-        scored = []
-        for tu in candidates:
-            text_content = tu.get("text", "")
-            if not text_content:
-                continue
-            # Embed text unit at query time
-            tu_embedding = await self.embedding_service.embed(text_content)
-            # Cosine similarity
-            similarity = self._cosine_similarity(query_embedding, tu_embedding)
-            scored.append((similarity, tu))
+        # Ranking only decides what to cut: when everything fits the budget
+        # anyway (small documents), skip the embedding round-trips entirely
+        total_tokens = sum(
+            tu.get("n_tokens") or len(tu.get("text", "")) // 4
+            for tu in candidates
+        )
+        if len(candidates) == 1 or total_tokens <= max_tokens:
+            return list(candidates)
+
+        # One batched embedding call for all candidates instead of one
+        # HTTP round-trip per text unit
+        with_text = [tu for tu in candidates if tu.get("text")]
+        if not with_text:
+            return []
+        embeddings = await self.embedding_service.embed_batch(
+            [tu["text"] for tu in with_text]
+        )
+
+        # All cosine similarities in one BLAS call: normalize both sides,
+        # then a single matrix-vector product scores every candidate
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+        query_vec = query_vec / (np.linalg.norm(query_vec) + 1e-12)
+        matrix = np.stack(embeddings).astype(np.float32, copy=False)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-12
+        similarities = matrix @ query_vec
 
         # Sort by similarity descending
-        scored.sort(key=lambda x: x[0], reverse=True)
+        order = np.argsort(-similarities)
+
+        return self._apply_token_budget([with_text[i] for i in order], max_tokens)
 
-        # Select top units within token budget
+    @staticmethod
+    def _apply_token_budget(text_units: list[dict], max_tokens: int) -> list[dict]:
+        """Keep the best-ranked prefix of text units within a token budget."""
         selected = []
         total_tokens = 0
-        for similarity, tu in scored:
+        for tu in text_units:
             tokens = tu.get("n_tokens") or len(tu.get("text", "")) // 4
             if total_tokens + tokens > max_tokens:
                 break
@@ -337,59 +685,33 @@ class GraphRAGRetriever:
 
         return selected
 
-    async def _get_communities_for_entities(
+    async def _get_community_reports_for_entities(
         self,
+        db: AsyncSession,
         collection_id: int,
         entity_ids: list[str],
-    ) -> list[int]:
-        """Look up community assignments for entities via nodes table."""
-        if not entity_ids:
-            return []
-
-        result = await self.db.execute(
-            text("""
-                SELECT DISTINCT community FROM nodes
-                WHERE collection_id = :collection_id
-                  AND id = ANY(:entity_ids)
-                  AND community IS NOT NULL
-            """),
-            {
-                "collection_id": collection_id,
-                "entity_ids": entity_ids,
-            }
-        )
-
-        return [row.community for row in result.fetchall()]
-
-    async def _get_community_reports_for_communities(
-        self,
-        collection_id: int,
-        community_ids: list[int],
         top_k: int,
     ) -> list[dict]:
         """Get reports for communities that contain found entities.
 
-        This connects community reports to the query via entities,
-        rather than just returning top-ranked reports globally.
+        This connects community reports to the query via entities — the
+        community lookup on nodes and the report fetch run as one CTE
+        statement instead of two round-trips. Falls back to global top-k
+        reports when the entities carry no community links.
         """
-        if not community_ids:
-            # Fallback to global top-k if no community links
-            return await self._get_community_reports(collection_id, top_k)
-
-        result = await self.db.execute(
-            text("""
-                SELECT id, title, summary, full_content, rank, level
-                FROM community_reports
-                WHERE collection_id = :collection_id
-                  AND community = ANY(:community_ids)
-                ORDER BY rank DESC
-                LIMIT :top_k
-            """),
+        if not entity_ids:
+            return await self._get_community_reports(db, collection_id, top_k)
+
+        result = await db.execute(
+            _COMMUNITY_REPORTS_FOR_ENTITIES_SQL,
             {
                 "collection_id": collection_id,
-                "community_ids": community_ids,
+                "entity_ids": entity_ids,
                 "top_k": top_k,
             }
         )
 
-        return [dict(row._mapping) for row in result.fetchall()]
+        reports = [dict(row._mapping) for row in result.fetchall()]
+        if reports:
+            return reports
+        return await self._get_community_reports(db, collection_id, top_k)
@@ -33,6 +33,13 @@ CREATE INDEX IF NOT EXISTS idx_documents_collection ON documents(collection_id);
 
 -- ============================================================
 -- Text Units (chunks with embeddings)
+-- Embeddings are stored as halfvec (FP16, pgvector >= 0.7): half the bytes
+-- per row and per distance computation vs float32, so twice as much of the
+-- HNSW index stays resident, with negligible recall loss for BGE-M3.
+-- Existing databases migrate with:
+--   ALTER TABLE text_units ALTER COLUMN embedding
+--       TYPE halfvec(1024) USING embedding::halfvec(1024);
+--   (same for entities), then recreate the hnsw indexes below.
 -- ============================================================
 CREATE TABLE IF NOT EXISTS text_units (
     id VARCHAR(64) PRIMARY KEY,  -- GraphRAG uses string IDs
@@ -43,12 +50,15 @@ CREATE TABLE IF NOT EXISTS text_units (
     page_start INTEGER,  -- First page this chunk appears on
     page_end INTEGER,  -- Last page this chunk appears on
     source_file VARCHAR(500),  -- Original source filename
-    embedding vector(1024),  -- BGE-M3 embeddings
+    embedding halfvec(1024),  -- BGE-M3 embeddings (FP16: half the bytes per distance calc)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX IF NOT EXISTS idx_text_units_collection ON text_units(collection_id);
-CREATE INDEX IF NOT EXISTS idx_text_units_embedding ON text_units USING hnsw (embedding vector_cosine_ops);
+CREATE INDEX IF NOT EXISTS idx_text_units_embedding ON text_units USING hnsw (embedding halfvec_cosine_ops);
+-- Support the post-import source_file backfill join
+CREATE INDEX IF NOT EXISTS idx_text_units_null_source ON text_units(collection_id) WHERE source_file IS NULL;
+CREATE INDEX IF NOT EXISTS idx_text_units_first_doc ON text_units((document_ids[1]));
 
 -- ============================================================
 -- Entities (graph nodes)
@@ -60,12 +70,12 @@ CREATE TABLE IF NOT EXISTS entities (
     type VARCHAR(100),
     description TEXT,
     text_unit_ids TEXT[],  -- Array of text unit IDs where entity appears
-    embedding vector(1024),  -- Entity description embedding
+    embedding halfvec(1024),  -- Entity description embedding (FP16)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX IF NOT EXISTS idx_entities_collection ON entities(collection_id);
-CREATE INDEX IF NOT EXISTS idx_entities_embedding ON entities USING hnsw (embedding vector_cosine_ops);
+CREATE INDEX IF NOT EXISTS idx_entities_embedding ON entities USING hnsw (embedding halfvec_cosine_ops);
 CREATE INDEX IF NOT EXISTS idx_entities_name ON entities USING gin(name gin_trgm_ops);
 
 -- ============================================================
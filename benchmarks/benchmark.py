@@ -11,8 +11,11 @@ Usage (from host):
 """
 
 import argparse
-import csv
+import asyncio
+import hashlib
+import heapq
 import json
+import mmap
 import os
 import re
 import shutil
@@ -20,7 +23,15 @@ import subprocess
 import sys
 import time
 import yaml
-from datetime import datetime
+# libyaml's C emitter when available; PyYAML silently falls back to the
+# pure-Python one otherwise
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
 
 # Paths inside container
@@ -29,36 +40,98 @@ DATA_DIR = APP_DIR / "tests" / "data" / "credo"
 RUNS_DIR = APP_DIR / "benchmark_runs"
 SETTINGS_TEMPLATE = APP_DIR / "settings.yaml.example"
 
+# App modules (kotaemon loaders) live under /app
+sys.path.insert(0, str(APP_DIR))
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Container-specific imports resolved once at module load: per-call imports
+# re-ran sys.path.insert every time and serialize on the import lock under
+# concurrent calls. Each is optional so the module still loads (and process-
+# pool workers still start) where a dependency is missing.
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
+
+try:
+    from rank_bm25 import BM25Okapi
+except ImportError:
+    BM25Okapi = None
+
+try:
+    from kotaemon.loaders.docling_loader import DoclingReader
+except ImportError:
+    DoclingReader = None
+
+try:
+    from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import PdfPipelineOptions
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+except ImportError:
+    DocumentConverter = None
+
 
 def get_pdf_files(num_files: int) -> list[Path]:
-    """Get PDF files from test data, sorted alphabetically."""
-    pdf_files = sorted(DATA_DIR.glob("*.pdf"))
-    return pdf_files[:num_files]
+    """Get the first N PDF files from test data, alphabetically.
+
+    heapq.nsmallest keeps only the N smallest names — O(N log k) instead of
+    sorting the whole directory to slice its head.
+    """
+    pdfs = (p for p in DATA_DIR.iterdir() if p.suffix.lower() == ".pdf")
+    return heapq.nsmallest(num_files, pdfs, key=attrgetter("name"))
+
+
+_SAFE_MODEL_CHARS = str.maketrans({":": "-", "/": "-"})
 
 
 def create_run_directory(model: str) -> Path:
     """Create timestamped run directory."""
-    timestamp = datetime.now().strftime("%y%m%d-%H%M")
-    model_safe = model.replace(":", "-").replace("/", "-")
+    timestamp = time.strftime("%y%m%d-%H%M")
+    model_safe = model.translate(_SAFE_MODEL_CHARS)
     run_dir = RUNS_DIR / model_safe / timestamp
     run_dir.mkdir(parents=True, exist_ok=True)
     return run_dir
 
 
-def extract_text_with_docling(pdf_path: Path, output_dir: Path) -> Path:
-    """Extract text from PDF using Docling (the actual loader)."""
-    sys.path.insert(0, str(APP_DIR))
+def extract_text_with_docling(
+    pdf_path: Path, output_dir: Path, backend: str = "pypdfium"
+) -> Path:
+    """Extract text from PDF using Docling.
 
-    from kotaemon.loaders.docling_loader import DoclingReader
-
-    reader = DoclingReader()
-    docs = reader.load_data(pdf_path)
+    The pypdfium backend skips OCR, table structure and the layout model —
+    roughly 2x the pages/s at a fraction of the memory — which is all the
+    benchmark needs to feed GraphRAG raw text. The native DoclingReader path
+    stays selectable for runs that need table quality.
+    """
+    if backend == "pypdfium":
+        if DocumentConverter is None:
+            raise ImportError("docling is not installed")
+        converter = DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(
+                    pipeline_options=PdfPipelineOptions(
+                        do_ocr=False, do_table_structure=False
+                    ),
+                    backend=PyPdfiumDocumentBackend,
+                )
+            }
+        )
+        text_parts = [converter.convert(pdf_path).document.export_to_markdown()]
+    else:
+        if DoclingReader is None:
+            raise ImportError("kotaemon is not installed")
+        reader = DoclingReader()
+        docs = reader.load_data(pdf_path)
 
-    # Combine text from all pages
-    text_parts = []
-    for doc in docs:
-        if doc.metadata.get("type", "text") == "text":
-            text_parts.append(doc.text)
+        # Combine text from all pages
+        text_parts = [
+            doc.text for doc in docs
+            if doc.metadata.get("type", "text") == "text"
+        ]
 
     # Write to txt file for GraphRAG
     txt_file = output_dir / f"{pdf_path.stem}.txt"
@@ -68,6 +141,64 @@ def extract_text_with_docling(pdf_path: Path, output_dir: Path) -> Path:
     return txt_file
 
 
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink src to dst, copying only when the filesystem refuses.
+
+    Cached text files re-enter every run directory; a hardlink is zero-copy
+    and shares the page cache, where shutil.copy duplicated MBs per run.
+    """
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        pass
+    except OSError:
+        shutil.copy(src, dst)
+
+
+def _pdf_hash(path: Path) -> str:
+    """SHA-256 of the file content.
+
+    Content-addressed cache keys survive renames and invalidate when a PDF
+    is updated in place — unlike the previous filename key, which did the
+    opposite on both counts. One streaming hash pass costs milliseconds
+    against Docling's seconds per page. (Chunked update rather than
+    hashlib.file_digest: the kotaemon container runs Python 3.10.)
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _extract_one(
+    pdf_file: Path,
+    input_dir: Path,
+    cache_dir: Path,
+    backend: str,
+    content_hash: str,
+) -> str:
+    """Extract one PDF and cache the result (process-pool worker).
+
+    Returns the status line for the parent process to print, since worker
+    stdout interleaves unpredictably.
+    """
+    txt_file = input_dir / f"{pdf_file.stem}.txt"
+    try:
+        txt_file = extract_text_with_docling(pdf_file, input_dir, backend)
+        # Cache for future runs, keyed by content; the .json pointer keeps
+        # the hash → source file mapping human-readable
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(txt_file, cache_dir / f"{content_hash}.txt")
+        with open(cache_dir / f"{pdf_file.stem}.json", "w") as f:
+            json.dump({"pdf": pdf_file.name, "sha256": content_hash}, f)
+        return f"    → {txt_file.name}"
+    except Exception as e:
+        # Fallback: just copy as txt (for testing)
+        txt_file.write_text(f"[Docling extraction failed for {pdf_file.name}]")
+        return f"    Error: {e}"
+
+
 def get_api_base(backend: str) -> str:
     """Get API base URL for the specified backend."""
     if backend == "vllm":
@@ -131,19 +262,25 @@ def create_graphrag_settings(run_dir: Path, model: str, backend: str = "ollama")
         "async_mode": "threaded",
         "embeddings": {
             "async_mode": "threaded",
+            # Batch chunks per embedding request instead of one-per-call;
+            # vLLM handles large batches, Ollama prefers modest ones. These
+            # keys are read at the embeddings level, not under llm.
+            "batch_size": 64 if backend == "vllm" else 16,
+            "batch_max_tokens": 8191,
             "llm": {
                 # Use vLLM for embeddings when using vllm backend, otherwise Ollama
                 "api_base": "http://vllm-embed:8000/v1" if backend == "vllm" else os.getenv("GRAPHRAG_API_BASE", "http://ollama:11434/v1"),
                 "api_key": os.getenv("GRAPHRAG_API_KEY", "ollama"),
                 "model": "BAAI/bge-m3" if backend == "vllm" else os.getenv("GRAPHRAG_EMBEDDING_MODEL", "bge-m3"),
                 "type": "openai_embedding",
+                "concurrent_requests": 25,
             }
         },
     }
 
     settings_file = run_dir / "settings.yaml"
     with open(settings_file, "w") as f:
-        yaml.dump(settings, f, default_flow_style=False)
+        yaml.dump(settings, f, Dumper=_YamlDumper, default_flow_style=False)
 
     return settings_file
 
@@ -152,227 +289,320 @@ def run_graphrag_index(run_dir: Path) -> tuple[bool, float]:
     """Run GraphRAG indexing and return success status and elapsed time."""
     start_time = time.time()
 
-    # Initialize
+    # Initialize (output discarded)
     init_cmd = [
         "python", "-m", "graphrag.index",
         "--root", str(run_dir),
         "--init",
     ]
-    subprocess.run(init_cmd, capture_output=True)
+    subprocess.run(init_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
     # Settings already created by create_graphrag_settings()
 
-    # Run indexing
+    # Run indexing, streaming output straight to the log files: a multi-
+    # minute run with --reporter rich would otherwise buffer its entire
+    # output in memory, and the logs only appeared after completion
     index_cmd = [
         "python", "-m", "graphrag.index",
         "--root", str(run_dir),
         "--reporter", "rich",
     ]
 
-    result = subprocess.run(index_cmd, capture_output=True, text=True)
+    with open(run_dir / "stdout.log", "wb") as stdout_log, \
+         open(run_dir / "stderr.log", "wb") as stderr_log:
+        result = subprocess.run(index_cmd, stdout=stdout_log, stderr=stderr_log)
 
     elapsed = time.time() - start_time
     success = result.returncode == 0
 
-    # Save output
-    with open(run_dir / "stdout.log", "w") as f:
-        f.write(result.stdout)
-    with open(run_dir / "stderr.log", "w") as f:
-        f.write(result.stderr)
-
     return success, elapsed
 
 
+# Compiled once: parse_indexing_log scans a potentially multi-MB log. The
+# alternation matches both line kinds in a single finditer pass over the
+# mmapped file, so uninteresting lines never reach Python code at all.
+_LOG_RE = re.compile(
+    rb"executing verb([^\n]*)"
+    rb"|perf - (llm\.chat|llm\.embedding)[^\n]*?took (\d+(?:\.\d+)?)"
+)
+_PHASE_RE = re.compile(rb"community_report|extract_graph|entity", re.I)
+
+
 def parse_indexing_log(run_dir: Path) -> dict:
     """Parse indexing-engine.log for timing data, separating entity extraction from community reports."""
     log_file = run_dir / "output" / "indexing-engine.log"
     if not log_file.exists():
         return {}
 
-    timings = {
-        "llm_calls": [],
-        "embedding_calls": [],
-        "total_llm_time": 0,
-        "total_embedding_time": 0,
-        # Separate entity extraction from community reports
-        "entity_extraction_calls": [],
-        "community_report_calls": [],
-        "total_entity_extraction_time": 0,
-        "total_community_report_time": 0,
-    }
+    # Only the chat-call list survives the loop (the CSV dump needs it);
+    # everything else accumulates as scalars
+    llm_calls = []
+    total_llm_time = 0.0
+    total_embedding_time = 0.0
+    total_entity_extraction_time = 0.0
+    total_community_report_time = 0.0
+    embedding_call_count = 0
+    entity_extraction_call_count = 0
+    community_report_call_count = 0
 
-    current_phase = "entity_extraction"  # Default phase
-
-    with open(log_file) as f:
-        for line in f:
-            # Track which workflow phase we're in
-            if "executing verb" in line:
-                if "community_report" in line.lower():
-                    current_phase = "community_reports"
-                elif "extract_graph" in line.lower() or "entity" in line.lower():
-                    current_phase = "entity_extraction"
-
-            # Parse LLM timing: perf - llm.chat ... took X.XXs
-            if "perf - llm.chat" in line:
-                match = re.search(r"took (\d+\.?\d*)", line)
-                if match:
-                    t = float(match.group(1))
-                    timings["llm_calls"].append(t)
-                    timings["total_llm_time"] += t
-
-                    # Categorize by phase
-                    if current_phase == "community_reports":
-                        timings["community_report_calls"].append(t)
-                        timings["total_community_report_time"] += t
-                    else:
-                        timings["entity_extraction_calls"].append(t)
-                        timings["total_entity_extraction_time"] += t
-
-            # Parse embedding timing
-            elif "perf - llm.embedding" in line:
-                match = re.search(r"took (\d+\.?\d*)", line)
-                if match:
-                    t = float(match.group(1))
-                    timings["embedding_calls"].append(t)
-                    timings["total_embedding_time"] += t
-
-    timings["llm_call_count"] = len(timings["llm_calls"])
-    timings["embedding_call_count"] = len(timings["embedding_calls"])
-    timings["entity_extraction_call_count"] = len(timings["entity_extraction_calls"])
-    timings["community_report_call_count"] = len(timings["community_report_calls"])
-
-    if timings["llm_calls"]:
-        timings["avg_llm_time"] = timings["total_llm_time"] / len(timings["llm_calls"])
-    else:
-        timings["avg_llm_time"] = 0
+    in_community_phase = False  # Default phase: entity extraction
 
-    if timings["entity_extraction_calls"]:
-        timings["avg_entity_extraction_time"] = timings["total_entity_extraction_time"] / len(timings["entity_extraction_calls"])
-    else:
-        timings["avg_entity_extraction_time"] = 0
+    with open(log_file, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            buf = b""  # zero-length logs cannot be mapped
+        for match in _LOG_RE.finditer(buf):
+            verb = match.group(1)
+            if verb is not None:
+                # Track which workflow phase we're in
+                phase = _PHASE_RE.search(verb)
+                if phase:
+                    in_community_phase = (
+                        phase.group(0).lower() == b"community_report"
+                    )
+                continue
+
+            # Timing match: perf - llm.chat|llm.embedding ... took X.XXs
+            t = float(match.group(3))
+            if match.group(2) == b"llm.chat":
+                llm_calls.append(t)
+                total_llm_time += t
+                # Categorize by phase
+                if in_community_phase:
+                    community_report_call_count += 1
+                    total_community_report_time += t
+                else:
+                    entity_extraction_call_count += 1
+                    total_entity_extraction_time += t
+            else:
+                embedding_call_count += 1
+                total_embedding_time += t
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
+    return {
+        "llm_calls": llm_calls,
+        "total_llm_time": total_llm_time,
+        "total_embedding_time": total_embedding_time,
+        "total_entity_extraction_time": total_entity_extraction_time,
+        "total_community_report_time": total_community_report_time,
+        "llm_call_count": len(llm_calls),
+        "embedding_call_count": embedding_call_count,
+        "entity_extraction_call_count": entity_extraction_call_count,
+        "community_report_call_count": community_report_call_count,
+        "avg_llm_time": total_llm_time / len(llm_calls) if llm_calls else 0,
+        "avg_entity_extraction_time": (
+            total_entity_extraction_time / entity_extraction_call_count
+            if entity_extraction_call_count else 0
+        ),
+        "avg_community_report_time": (
+            total_community_report_time / community_report_call_count
+            if community_report_call_count else 0
+        ),
+    }
 
-    if timings["community_report_calls"]:
-        timings["avg_community_report_time"] = timings["total_community_report_time"] / len(timings["community_report_calls"])
-    else:
-        timings["avg_community_report_time"] = 0
 
-    return timings
+def _num_rows(parquet_file: Path) -> int:
+    """Row count from the parquet footer — a few kB of I/O, no column decode."""
+    if not parquet_file.exists():
+        return 0
+    return pq.ParquetFile(parquet_file).metadata.num_rows
 
 
 def count_entities(run_dir: Path) -> dict:
     """Count entities and relationships from output parquet files."""
-    import pandas as pd
-
     output_dir = run_dir / "output"
-    counts = {"entities": 0, "relationships": 0, "text_units": 0}
+    return {
+        "entities": _num_rows(output_dir / "create_final_entities.parquet"),
+        "relationships": _num_rows(output_dir / "create_final_relationships.parquet"),
+        "text_units": _num_rows(output_dir / "create_final_text_units.parquet"),
+    }
 
-    entities_file = output_dir / "create_final_entities.parquet"
-    if entities_file.exists():
-        df = pd.read_parquet(entities_file)
-        counts["entities"] = len(df)
 
-    relationships_file = output_dir / "create_final_relationships.parquet"
-    if relationships_file.exists():
-        df = pd.read_parquet(relationships_file)
-        counts["relationships"] = len(df)
+_WORD_RE = re.compile(r"\w+")
 
-    text_units_file = output_dir / "create_final_text_units.parquet"
-    if text_units_file.exists():
-        df = pd.read_parquet(text_units_file)
-        counts["text_units"] = len(df)
+# Keyword extraction for the fallback ranker: the [a-z]{4,} regex folds the
+# split + length check into one C-level scan, and the frozenset makes each
+# stopword probe a hash lookup instead of a tuple scan
+_KEYWORD_RE = re.compile(r"[a-z]{4,}")
+_STOPWORDS = frozenset({
+    "what", "which", "where", "when", "does", "have", "with", "from",
+    "that", "this", "there", "been", "were", "will", "your", "about",
+})
+
+# tiktoken encoding, resolved once (False = unavailable, stay char-based)
+_ENCODING = None
 
-    return counts
+
+def _get_encoding():
+    global _ENCODING
+    if _ENCODING is None:
+        try:
+            import tiktoken
+            _ENCODING = tiktoken.get_encoding("cl100k_base")
+        except ImportError:
+            _ENCODING = False
+    return _ENCODING or None
 
 
-def run_quality_test(run_dir: Path, model: str, question: str, question_id: int = 1, backend: str = "ollama"):
-    """Run quality test using the indexed data.
+def _pack_context(parts: list[str], max_tokens: int = 8000) -> str:
+    """Join context parts up to a token budget.
+
+    Uses the same cl100k_base encoding as the GraphRAG settings, so the
+    budget counts what the server actually tokenizes — a character cap
+    under-fills the context by roughly 4x. tiktoken's Rust encoder makes
+    the counting cost negligible; without it the char cap remains.
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return "\n\n".join(parts)[:8000]
+
+    separator = encoding.encode("\n\n")
+    packed: list[int] = []
+    for part in parts:
+        tokens = encoding.encode(part)
+        if packed:
+            tokens = separator + tokens
+        remaining = max_tokens - len(packed)
+        if remaining <= 0:
+            break
+        packed.extend(tokens[:remaining])
+    return encoding.decode(packed)
+
+
+def _rank_text_units(texts, question: str, top_k: int = 15):
+    """Rank text units against the question, returning the top-k index.
+
+    Prefers BM25 (precomputed IDF, one sparse scoring pass per query) for a
+    far less noisy quality signal than substring counting; falls back to the
+    vectorized keyword-count scan when rank_bm25 isn't installed.
+    """
+    question_lower = question.lower()
+    if BM25Okapi is not None:
+        tokenized = [_WORD_RE.findall(t) for t in texts.str.lower()]
+        scores = BM25Okapi(tokenized).get_scores(_WORD_RE.findall(question_lower))
+        # Partial selection (C quickselect) keeps the top k without sorting
+        # every text unit; only the kept k get ordered
+        if len(scores) > top_k:
+            kept = np.argpartition(-scores, top_k)[:top_k]
+            return texts.index[kept[np.argsort(-scores[kept])]]
+        return texts.index[np.argsort(-scores)]
+
+    # Fallback: keyword occurrences via one alternation-regex scan in C
+    keywords = [w for w in _KEYWORD_RE.findall(question_lower) if w not in _STOPWORDS]
+    if not keywords:
+        return texts.index[:top_k]
+    pattern = "|".join(map(re.escape, keywords))
+    return texts.str.lower().str.count(pattern).nlargest(top_k).index
+
+
+async def _ask_all(
+    messages_list: list, query_api_base: str, query_model: str, concurrency: int
+) -> list[tuple[str, float]]:
+    """Fire the quality-test chat calls concurrently, bounded by a semaphore."""
+    client = AsyncOpenAI(base_url=query_api_base, api_key="ollama")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def ask(messages):
+        async with semaphore:
+            start_time = time.time()
+            response = await client.chat.completions.create(
+                model=query_model,
+                messages=messages,
+                max_tokens=500,
+            )
+            return response.choices[0].message.content, time.time() - start_time
+
+    return await asyncio.gather(*[ask(m) for m in messages_list])
+
+
+def run_quality_test(run_dir: Path, model: str, questions: list[str], backend: str = "ollama") -> list[str]:
+    """Run quality tests for one or more questions against the indexed data.
+
+    Retrieval contexts are built up front, then all chat calls fan out
+    concurrently — vLLM batches them on the GPU, so N questions cost little
+    more than one. Ollama serves requests one at a time, so that backend
+    stays sequential (semaphore of 1).
 
     Note: Always uses Ollama for Q&A since extraction models (like LFM2-Extract)
     can't do general chat. The 'model' param is only used if backend is ollama.
     """
-    sys.path.insert(0, str(APP_DIR))
-
-    from openai import OpenAI
-    import pandas as pd
-
     # Load entities for context
     output_dir = run_dir / "output"
-    context_parts = []
+    shared_parts = []
 
-    # Load community reports if available
+    # Load community reports if available — only the two columns used, not
+    # the whole (embedding-bearing) table
     reports_file = output_dir / "create_final_community_reports.parquet"
     if reports_file.exists():
-        df = pd.read_parquet(reports_file)
-        for _, row in df.head(5).iterrows():
-            context_parts.append(f"Report: {row.get('title', '')}\n{row.get('content', '')[:1000]}")
-
-    # Load text units for context - use keyword matching for relevance
+        reports = pq.read_table(
+            reports_file, columns=["title", "content"]
+        ).slice(0, 5).to_pylist()
+        for row in reports:
+            shared_parts.append(f"Report: {row.get('title') or ''}\n{(row.get('content') or '')[:1000]}")
+
+    # Load text units once — project just the text column. ArrowDtype keeps
+    # the column as a zero-copy view over the Arrow buffer instead of
+    # materializing every string as a Python object.
+    texts = None
     text_units_file = output_dir / "create_final_text_units.parquet"
     if text_units_file.exists():
-        df = pd.read_parquet(text_units_file)
-
-        # Extract keywords from question for basic retrieval
-        question_lower = question.lower()
-        keywords = [w for w in question_lower.split() if len(w) > 3 and w not in ("what", "which", "where", "when", "does", "have", "with", "from", "that", "this", "there")]
-
-        # Score text units by keyword matches
-        scored_units = []
-        for idx, row in df.iterrows():
-            text = row.get("text", "")
-            text_lower = text.lower()
-            score = sum(1 for kw in keywords if kw in text_lower)
-            scored_units.append((score, idx, text))
-
-        # Sort by score descending, take top 15
-        scored_units.sort(key=lambda x: -x[0])
-        for score, idx, text in scored_units[:15]:
-            context_parts.append(text[:800])
-
-    context = "\n\n".join(context_parts)[:8000]
+        texts = (
+            pq.read_table(text_units_file, columns=["text"])
+            .column("text").to_pandas(types_mapper=pd.ArrowDtype).fillna("")
+        )
+
+    # Build per-question retrieval contexts up front
+    messages_list = []
+    for question in questions:
+        context_parts = list(shared_parts)
+        if texts is not None:
+            top_idx = _rank_text_units(texts, question)
+            context_parts.extend(texts.loc[top_idx].str.slice(0, 800).tolist())
+        context = _pack_context(context_parts)
+        messages_list.append([
+            {"role": "system", "content": "Answer based on the context. Be concise."},
+            {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {question}"},
+        ])
 
-    # Save question
+    # Save questions
     questions_dir = run_dir / "questions"
     questions_dir.mkdir(exist_ok=True)
-    with open(questions_dir / f"{question_id}.txt", "w") as f:
-        f.write(question)
+    for question_id, question in enumerate(questions, 1):
+        with open(questions_dir / f"{question_id}.txt", "w") as f:
+            f.write(question)
 
     # Query LLM - use appropriate chat model (extraction models can't chat)
     if backend == "vllm":
-        # Use vLLM chat service for Q&A (7B model for better quality)
+        # Use vLLM chat service for Q&A (7B model for better quality);
+        # concurrency matches concurrent_requests in the GraphRAG settings
         query_api_base = "http://vllm-chat:8000/v1"
         query_model = "Qwen/Qwen2.5-7B-Instruct"
+        concurrency = 32
     else:
-        # Use Ollama
+        # Use Ollama (single-threaded — no benefit from fan-out)
         query_api_base = os.getenv("GRAPHRAG_API_BASE", "http://ollama:11434/v1")
         query_model = model
+        concurrency = 1
 
-    client = OpenAI(
-        base_url=query_api_base,
-        api_key="ollama"
-    )
-
-    start_time = time.time()
-    response = client.chat.completions.create(
-        model=query_model,
-        messages=[
-            {"role": "system", "content": "Answer based on the context. Be concise."},
-            {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {question}"},
-        ],
-        max_tokens=500,
+    results = asyncio.run(
+        _ask_all(messages_list, query_api_base, query_model, concurrency)
     )
-    elapsed = time.time() - start_time
-    answer = response.choices[0].message.content
 
-    # Save answer
+    # Save answers
     answers_dir = run_dir / "answers"
     answers_dir.mkdir(exist_ok=True)
-    with open(answers_dir / f"{question_id}.txt", "w") as f:
-        f.write(f"Question: {question}\n")
-        f.write(f"Query Model: {query_model}\n")
-        f.write(f"Time: {elapsed:.2f}s\n")
-        f.write(f"\nAnswer:\n{answer}\n")
+    for question_id, (question, (answer, elapsed)) in enumerate(
+        zip(questions, results), 1
+    ):
+        with open(answers_dir / f"{question_id}.txt", "w") as f:
+            f.write(f"Question: {question}\n")
+            f.write(f"Query Model: {query_model}\n")
+            f.write(f"Time: {elapsed:.2f}s\n")
+            f.write(f"\nAnswer:\n{answer}\n")
 
-    return answer
+    return [answer for answer, _ in results]
 
 
 def main():
@@ -381,6 +611,7 @@ def main():
     parser.add_argument("--num-files", type=int, default=1, help="Number of PDF files (1-6)")
     parser.add_argument("--force", action="store_true", help="Force fresh indexing (don't reuse cached chunks)")
     parser.add_argument("--backend", choices=["ollama", "vllm"], default="ollama", help="Inference backend")
+    parser.add_argument("--docling-backend", choices=["native", "pypdfium"], default="pypdfium", help="Docling PDF backend (pypdfium is ~2x faster; native keeps table structure)")
 
     args = parser.parse_args()
 
@@ -413,27 +644,37 @@ def main():
     cache_dir = RUNS_DIR / "extracted_text"
 
     print(f"\n[Step 1] Extracting text with Docling...")
+    to_extract = []
+    hashes = []
     for pdf_file in pdf_files:
         txt_file = input_dir / f"{pdf_file.stem}.txt"
-        cached_file = cache_dir / f"{pdf_file.stem}.txt"
+        content_hash = _pdf_hash(pdf_file)
+        cached_file = cache_dir / f"{content_hash}.txt"
 
         # Use cached extraction if available
         if cached_file.exists():
             print(f"  Using cached: {pdf_file.name}")
-            shutil.copy(cached_file, txt_file)
-            continue
-
-        print(f"  Processing: {pdf_file.name}")
-        try:
-            txt_file = extract_text_with_docling(pdf_file, input_dir)
-            print(f"    → {txt_file.name}")
-            # Cache for future runs
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            shutil.copy(txt_file, cached_file)
-        except Exception as e:
-            print(f"    Error: {e}")
-            # Fallback: just copy as txt (for testing)
-            txt_file.write_text(f"[Docling extraction failed for {pdf_file.name}]")
+            _link_or_copy(cached_file, txt_file)
+        else:
+            print(f"  Processing: {pdf_file.name}")
+            to_extract.append(pdf_file)
+            hashes.append(content_hash)
+
+    if to_extract:
+        # Each PDF is independent and Docling is CPU-bound on its layout
+        # models, so uncached files extract in parallel across processes.
+        # Splitting OMP threads between workers keeps Docling's internal
+        # thread pool from oversubscribing the cores.
+        workers = min(len(to_extract), os.cpu_count() or 1)
+        os.environ.setdefault(
+            "OMP_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // workers))
+        )
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for message in executor.map(
+                _extract_one, to_extract, repeat(input_dir), repeat(cache_dir),
+                repeat(args.docling_backend), hashes
+            ):
+                print(message)
 
     # Create settings
     print(f"\n[Step 2] Creating GraphRAG settings...")
@@ -470,18 +711,23 @@ def main():
         # Also save as CSV for the entity extraction calls
         if timings.get("llm_calls"):
             csv_file = run_dir / "entity_timings.csv"
-            with open(csv_file, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(["call_index", "elapsed_seconds"])
-                for i, t in enumerate(timings["llm_calls"]):
-                    writer.writerow([i, t])
+            calls = np.asarray(timings["llm_calls"])
+            np.savetxt(
+                csv_file,
+                np.column_stack([np.arange(len(calls)), calls]),
+                fmt=["%d", "%.6f"],
+                delimiter=",",
+                header="call_index,elapsed_seconds",
+                comments="",
+            )
 
     # Quality test
     print(f"\n[Step 4] Running quality test...")
-    question = "Is Cadent cost of heat failures in the MVP?"
-    answer = run_quality_test(run_dir, args.model, question, question_id=1, backend=args.backend)
-    print(f"  Q: {question}")
-    print(f"  A: {answer[:200]}...")
+    questions = ["Is Cadent cost of heat failures in the MVP?"]
+    answers = run_quality_test(run_dir, args.model, questions, backend=args.backend)
+    for question, answer in zip(questions, answers):
+        print(f"  Q: {question}")
+        print(f"  A: {answer[:200]}...")
 
     # Summary
     print(f"\n{'=' * 60}")
@@ -2,11 +2,11 @@
 # Start both FastAPI backend and Gradio frontend
 
 # Install FastAPI dependencies
-pip install -q fastapi uvicorn sse-starlette
+pip install -q fastapi uvicorn[standard] sse-starlette orjson httpx[http2]
 
-# Start FastAPI in background
+# Start FastAPI in background (uvloop + httptools via uvicorn[standard])
 cd /app
-python -m uvicorn backend.main:app --host 0.0.0.0 --port 8000 &
+python -m uvicorn backend.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools &
 
 # Start Gradio (foreground - this is the main process)
 exec /app/launch.sh